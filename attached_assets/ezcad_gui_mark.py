@@ -9,6 +9,8 @@ For more information on how to use these identifiers with PyWinAuto, see:
 https://pywinauto.readthedocs.io/en/latest/
 """
 
+from types import MappingProxyType
+
 # Main application window identifiers
 EZCAD_MAIN_WINDOW = {
     'title': 'EZCAD2',
@@ -190,6 +192,14 @@ DRAWING_AREA = {
     'control_id': 59648  # This ID may vary, verify with spy tool
 }
 
+# Read-only views of frequently used specs, built once at import.
+# These tables never change at runtime, so getters can share them safely.
+RED_BUTTON_SPEC = MappingProxyType(TOOLBAR_BUTTONS['red'])
+MARK_BUTTON_SPEC = MappingProxyType(TOOLBAR_BUTTONS['mark'])
+MAIN_WINDOW_SPEC = MappingProxyType(EZCAD_MAIN_WINDOW)
+OPEN_FILE_DIALOG_SPEC = MappingProxyType(DIALOGS['open_file'])
+_get_shortcut = KEYBOARD_SHORTCUTS.get
+
 # Common automation functions
 
 def get_red_button_spec():
@@ -197,36 +207,36 @@ def get_red_button_spec():
     Get the spec to identify the Red button in EZCAD2 toolbar
     
     Returns:
-        dict: Button specification for PyWinAuto
+        Mapping: Read-only button specification for PyWinAuto
     """
-    return TOOLBAR_BUTTONS['red']
+    return RED_BUTTON_SPEC
 
 def get_mark_button_spec():
     """
     Get the spec to identify the Mark button in EZCAD2 toolbar
     
     Returns:
-        dict: Button specification for PyWinAuto
+        Mapping: Read-only button specification for PyWinAuto
     """
-    return TOOLBAR_BUTTONS['mark']
+    return MARK_BUTTON_SPEC
 
 def get_main_window_spec():
     """
     Get the spec to identify the main EZCAD2 window
     
     Returns:
-        dict: Window specification for PyWinAuto
+        Mapping: Read-only window specification for PyWinAuto
     """
-    return EZCAD_MAIN_WINDOW
+    return MAIN_WINDOW_SPEC
 
 def get_open_file_dialog_spec():
     """
     Get the spec to identify the Open File dialog
     
     Returns:
-        dict: Dialog specification for PyWinAuto
+        Mapping: Read-only dialog specification for PyWinAuto
     """
-    return DIALOGS['open_file']
+    return OPEN_FILE_DIALOG_SPEC
 
 def get_keyboard_shortcut(action):
     """
@@ -238,4 +248,4 @@ def get_keyboard_shortcut(action):
     Returns:
         str: Keyboard shortcut string for PyWinAuto
     """
-    return KEYBOARD_SHORTCUTS.get(action, '')
\ No newline at end of file
+    return _get_shortcut(action, '')
\ No newline at end of file
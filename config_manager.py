@@ -1,4 +1,5 @@
 import os
+import io
 import configparser
 import json
 from datetime import datetime
@@ -11,6 +12,9 @@ class ConfigManager:
         self.config_file = config_file
         self.profiles_dir = profiles_dir
         self.config = configparser.ConfigParser()
+        self._dirty = False  # True when in-memory values differ from the file
+        self._profile_cache = {}  # profile_file -> (mtime, parsed profile dict)
+        self._profiles_listing = None  # (profiles_dir mtime_ns, profile names)
         
         # Ensure profiles directory exists
         if not os.path.exists(self.profiles_dir):
@@ -23,10 +27,11 @@ class ConfigManager:
         """Load configuration from file or create with defaults"""
         if os.path.exists(self.config_file):
             self.config.read(self.config_file)
+            self._dirty = False
         else:
             self._create_default_config()
     
-    def _create_default_config(self):
+    def _create_default_config(self, save=True):
         """Create a default configuration file"""
         # Paths section
         self.config["Paths"] = {
@@ -51,16 +56,35 @@ class ConfigManager:
         self.config["Monitoring"] = {
             "enabled": "false",
             "interval_seconds": "5",
-            "recursive": "false"
+            "recursive": "false",
+            "process_existing": "false"
         }
         
         # Save default configuration
-        self.save_config()
+        self._dirty = True
+        if save:
+            self.save_config()
     
     def save_config(self):
-        """Save configuration to file"""
+        """Save configuration to file if anything changed since the last save"""
+        text = self.take_pending_save()
+        if text is not None:
+            self.write_config_text(text)
+    
+    def take_pending_save(self):
+        """Render the .ini text to write if anything changed since the last save, or None
+        
+        The config counts as saved afterwards; pass the text to write_config_text.
+        """
+        if not self._dirty and os.path.exists(self.config_file):
+            return None
+        self._dirty = False
+        return self._serialize(self.config)
+    
+    def write_config_text(self, text):
+        """Write rendered .ini text to the config file (safe to call from a worker thread)"""
         with open(self.config_file, "w") as f:
-            self.config.write(f)
+            f.write(text)
     
     def get(self, section, key, fallback=None):
         """Get a configuration value"""
@@ -76,9 +100,38 @@ class ConfigManager:
     
     def set(self, section, key, value):
         """Set a configuration value"""
+        value = str(value)
         if not self.config.has_section(section):
             self.config.add_section(section)
-        self.config.set(section, key, str(value))
+        if self.config.get(section, key, raw=True, fallback=None) != value:
+            self.config.set(section, key, value)
+            self._dirty = True
+    
+    def snapshot(self):
+        """Get all sections as a nested dict of raw string values"""
+        return {section: dict(self.config.items(section, raw=True))
+                for section in self.config.sections()}
+    
+    def update(self, values, save=True):
+        """Set many values from a nested {section: {key: value}} dict and save once"""
+        for section, options in values.items():
+            for key, value in options.items():
+                self.set(section, key, value)
+        if save:
+            self.save_config()
+    
+    @staticmethod
+    def to_bool(value, fallback=False):
+        """Convert a raw config string to a boolean like ConfigParser.getboolean"""
+        return configparser.ConfigParser.BOOLEAN_STATES.get(str(value).lower(), fallback)
+    
+    @staticmethod
+    def to_int(value, fallback=0):
+        """Convert a raw config string to an integer"""
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return fallback
     
     def save_profile(self, profile_name):
         """Save current configuration as a named profile"""
@@ -103,16 +156,22 @@ class ConfigManager:
         
         return profile_file
     
-    def load_profile(self, profile_name):
+    def load_profile(self, profile_name, save=True):
         """Load a named profile"""
         profile_file = os.path.join(self.profiles_dir, f"{profile_name}.json")
         
         if not os.path.exists(profile_file):
             raise FileNotFoundError(f"Profile '{profile_name}' not found")
         
-        # Load profile from file
-        with open(profile_file, "r") as f:
-            config_dict = json.load(f)
+        # Load profile from file, reusing the parsed copy if it hasn't changed
+        mtime = os.path.getmtime(profile_file)
+        cached = self._profile_cache.get(profile_file)
+        if cached is not None and cached[0] == mtime:
+            config_dict = cached[1]
+        else:
+            with open(profile_file, "r") as f:
+                config_dict = json.load(f)
+            self._profile_cache[profile_file] = (mtime, config_dict)
         
         # Create new config parser and populate it
         new_config = configparser.ConfigParser()
@@ -123,15 +182,28 @@ class ConfigManager:
                 for key, value in options.items():
                     new_config.set(section, key, str(value))
         
-        # Replace current config with loaded one
-        self.config = new_config
-        self.save_config()
+        # Replace current config with loaded one, only rewriting the file on change
+        if self._serialize(new_config) != self._serialize(self.config):
+            self.config = new_config
+            self._dirty = True
+            if save:
+                self.save_config()
+    
+    def _serialize(self, config):
+        """Render a ConfigParser to its .ini text"""
+        buffer = io.StringIO()
+        config.write(buffer)
+        return buffer.getvalue()
     
     def list_profiles(self):
         """List all available profiles"""
-        profiles = []
-        for file in os.listdir(self.profiles_dir):
-            if file.endswith(".json"):
-                profile_name = os.path.splitext(file)[0]
-                profiles.append(profile_name)
-        return profiles
+        dir_mtime = os.stat(self.profiles_dir).st_mtime_ns
+        if self._profiles_listing is not None and self._profiles_listing[0] == dir_mtime:
+            return list(self._profiles_listing[1])
+        
+        with os.scandir(self.profiles_dir) as entries:
+            profiles = [entry.name[:-5] for entry in entries
+                        if entry.name.endswith(".json") and entry.is_file()]
+        profiles.sort()  # Sorted once per directory change, not per dialog open
+        self._profiles_listing = (dir_mtime, profiles)
+        return list(profiles)
@@ -1,8 +1,25 @@
+import numpy as np
 import pandas as pd
 import os
+import shutil
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime
 
+# python-calamine (Rust reader) is optional; fall back to openpyxl when absent
+try:
+    from python_calamine import CalamineWorkbook
+    HAS_CALAMINE = True
+except ImportError:
+    HAS_CALAMINE = False
+
+# Parsed workbooks kept in memory, most recently used last
+CACHE_SIZE = 4
+
+# Formats calamine can read for previews, including legacy .xls
+CALAMINE_EXTENSIONS = ('.xlsx', '.xlsm', '.xlsb', '.xls', '.ods')
+
 class ExcelHandler:
     """Handle Excel file operations including reading, validation, and data extraction"""
     
@@ -11,6 +28,10 @@ class ExcelHandler:
         self.logger = logger or logging.getLogger('EZCADAutomation')
         self.current_file = None
         self.current_data = None
+        # (abspath, mtime_ns, size) -> DataFrame; cached frames are never modified
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()  # Loads run on worker threads
+        self._dirty = False
     
     def load_excel(self, file_path):
         """Load an Excel file and return the DataFrame"""
@@ -22,14 +43,31 @@ class ExcelHandler:
                 self.logger.error(f"Excel file not found: {file_path}")
                 return None
             
+            # Reuse the parsed DataFrame if the file has not changed on disk
+            df = self.get_cached(file_path)
+            if df is not None:
+                self.current_file = file_path
+                self.current_data = df
+                self._dirty = False
+                self.logger.debug(f"Using cached Excel data: {file_path}")
+                return df
+            
             # Use appropriate engine based on file extension
-            engine = 'xlrd' if file_path.lower().endswith('.xls') else None
+            if file_path.lower().endswith('.xls'):
+                engine = 'xlrd'
+            elif HAS_CALAMINE:
+                engine = 'calamine'
+            else:
+                engine = None
             
-            # Load the file
+            # Keep the inferred dtypes: save_processed_status writes this frame
+            # back to the workbook, so numbers and dates must stay typed
             df = pd.read_excel(file_path, engine=engine)
             
             self.current_file = file_path
             self.current_data = df
+            self._cache_store(file_path, df)
+            self._dirty = False
             
             self.logger.info(f"Excel file loaded successfully: {file_path}")
             self.logger.debug(f"Excel dimensions: {df.shape[0]} rows, {df.shape[1]} columns")
@@ -40,32 +78,115 @@ class ExcelHandler:
             self.logger.error(f"Failed to load Excel file {file_path}: {str(e)}")
             return None
     
+    def _cache_key(self, file_path):
+        """Identify a file version by path, modification time and size"""
+        st = os.stat(file_path)
+        return (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+
+    def get_cached(self, file_path):
+        """Get the parsed DataFrame for a file if it is cached and unchanged"""
+        try:
+            cache_key = self._cache_key(file_path)
+        except OSError:
+            return None
+        with self._cache_lock:
+            df = self._cache.get(cache_key)
+            if df is not None:
+                self._cache.move_to_end(cache_key)
+        return df
+
+    def _cache_store(self, file_path, df):
+        """Cache a DataFrame for the file's current version, dropping stale entries"""
+        cache_key = self._cache_key(file_path)
+        with self._cache_lock:
+            for key in [key for key in self._cache if key[0] == cache_key[0]]:
+                del self._cache[key]
+            self._cache[cache_key] = df
+            while len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def load_preview(self, file_path, max_rows=5, max_cols=10):
+        """Read only the first rows of an Excel file and return a string preview
+
+        Unlike load_excel this does not build a DataFrame and does not touch
+        current_file/current_data, so it stays cheap on large workbooks.
+        """
+        try:
+            if not os.path.exists(file_path):
+                self.logger.error(f"Excel file not found: {file_path}")
+                return None
+
+            if HAS_CALAMINE and file_path.lower().endswith(CALAMINE_EXTENSIONS):
+                workbook = CalamineWorkbook.from_path(file_path)
+                try:
+                    sheet = workbook.get_sheet_by_index(0)
+                    rows = [row[:max_cols] for row in sheet.to_python(nrows=max_rows + 1)]
+                finally:
+                    if hasattr(workbook, 'close'):
+                        workbook.close()
+            elif file_path.lower().endswith('.xls'):
+                import xlrd
+                workbook = xlrd.open_workbook(file_path, on_demand=True)
+                try:
+                    sheet = workbook.sheet_by_index(0)
+                    ncols = min(max_cols, sheet.ncols)
+                    rows = [sheet.row_values(row_idx, 0, ncols)
+                            for row_idx in range(min(max_rows + 1, sheet.nrows))]
+                finally:
+                    workbook.release_resources()
+            else:
+                import openpyxl
+                workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+                try:
+                    sheet = workbook.worksheets[0]
+                    ncols = min(max_cols, sheet.max_column or max_cols)
+                    rows = list(sheet.iter_rows(max_row=max_rows + 1, max_col=ncols, values_only=True))
+                finally:
+                    workbook.close()
+
+            if not rows:
+                return ""
+
+            headers = [self._cell_text(val) for val in rows[0]]
+            data_rows = [[self._cell_text(val) for val in row] for row in rows[1:]]
+            return self._format_preview(headers, data_rows)
+
+        except Exception as e:
+            self.logger.error(f"Error generating Excel preview for {file_path}: {str(e)}")
+            return None
+
+    @staticmethod
+    def _cell_text(value):
+        """Render a raw cell value for the preview"""
+        if value is None:
+            return ""
+        # calamine and xlrd return every number as float; show 1 rather than 1.0
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value)
+
+    def _format_preview(self, headers, rows):
+        """Format header and row values as fixed-width preview text"""
+        # Casting into a fixed-width '<U8' array truncates every cell in C;
+        # a single np.char.ljust call then pads them all
+        table = np.empty((len(rows) + 1, len(headers)), dtype='<U8')
+        table[0] = headers
+        if len(rows):
+            table[1:] = rows
+        return "\n".join(" ".join(row) for row in np.char.ljust(table, 8).tolist())
+
     def get_preview(self, max_rows=5, max_cols=10):
         """Get a string preview of the current DataFrame"""
         if self.current_data is None:
             return "No Excel file loaded"
         
         try:
-            preview_rows = []
-            # Get column headers
-            headers = []
-            for col_idx in range(min(max_cols, self.current_data.shape[1])):
-                col_name = str(self.current_data.columns[col_idx])
-                headers.append(col_name[:8].ljust(8))
-            preview_rows.append(" ".join(headers))
-            
-            # Get data rows
-            for row_idx in range(min(max_rows, self.current_data.shape[0])):
-                row_cells = []
-                for col_idx in range(min(max_cols, self.current_data.shape[1])):
-                    try:
-                        val = str(self.current_data.iat[row_idx, col_idx])
-                    except:
-                        val = ""
-                    row_cells.append(val[:8].ljust(8))
-                preview_rows.append(" ".join(row_cells))
-            
-            return "\n".join(preview_rows)
+            # Slice once and convert the whole block to strings in one pass;
+            # empty cells show blank rather than 'nan'
+            preview = self.current_data.iloc[:max_rows, :max_cols].astype(object)
+            preview = preview.where(preview.notna(), '')
+            headers = [str(col) for col in preview.columns]
+            return self._format_preview(headers, preview.to_numpy().astype(str))
         
         except Exception as e:
             self.logger.error(f"Error generating Excel preview: {str(e)}")
@@ -94,21 +215,23 @@ class ExcelHandler:
         return True
     
     def get_batch_data(self, batch_size=10):
-        """Get data in batches for processing"""
+        """Yield the loaded data in batches for processing
+
+        Batches are views sliced from the loaded DataFrame, so every format
+        yields the same value types and each batch keeps the original row
+        positions as its index.
+        """
         if self.current_data is None:
             self.logger.error("No Excel file loaded for batch processing")
-            return []
+            return
         
         total_rows = self.current_data.shape[0]
-        batches = []
-        
+        batch_count = 0
         for start_idx in range(0, total_rows, batch_size):
-            end_idx = min(start_idx + batch_size, total_rows)
-            batch = self.current_data.iloc[start_idx:end_idx]
-            batches.append(batch)
+            yield self.current_data.iloc[start_idx:start_idx + batch_size]
+            batch_count += 1
         
-        self.logger.info(f"Split data into {len(batches)} batches")
-        return batches
+        self.logger.info(f"Split data into {batch_count} batches")
     
     def save_processed_status(self, processed_rows, status_col='Processed', timestamp_col='Processed_Time'):
         """Save processing status back to the Excel file"""
@@ -117,28 +240,44 @@ class ExcelHandler:
             return False
         
         try:
-            # Create backup of original file
-            backup_file = f"{os.path.splitext(self.current_file)[0]}_backup_{datetime.now().strftime('%Y%m%d%H%M%S')}.xlsx"
-            self.current_data.to_excel(backup_file, index=False)
-            self.logger.info(f"Created backup of Excel file: {backup_file}")
+            # Frames from load_excel are shared with the cache; mark a private copy
+            # so a failed write can't leave the cache out of step with the file
+            data = self.current_data if self._dirty else self.current_data.copy()
+            self.current_data = data
             
             # Add status columns if they don't exist
-            if status_col not in self.current_data.columns:
-                self.current_data[status_col] = ''
-            if timestamp_col not in self.current_data.columns:
-                self.current_data[timestamp_col] = ''
-            
-            # Update status for processed rows
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            for row_idx in processed_rows:
-                if 0 <= row_idx < self.current_data.shape[0]:
-                    self.current_data.at[row_idx, status_col] = 'Processed'
-                    self.current_data.at[row_idx, timestamp_col] = timestamp
+            for col in (status_col, timestamp_col):
+                if col not in data.columns:
+                    data[col] = pd.Series('', index=data.index, dtype='object')
+            
+            # Update status for all valid processed rows in one assignment
+            idx = np.asarray(list(processed_rows), dtype=np.int64)
+            idx = idx[(idx >= 0) & (idx < data.shape[0])]
+            if idx.size:
+                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                data.loc[idx, status_col] = 'Processed'
+                data.loc[idx, timestamp_col] = timestamp
+                self._dirty = True
+            
+            # Nothing changed, skip rewriting the workbook
+            if not self._dirty:
+                self.logger.info("No rows updated, Excel file left unchanged")
+                return True
+            
+            # Back up the untouched file on disk (raw copy, no re-serialization)
+            base, ext = os.path.splitext(self.current_file)
+            backup_file = f"{base}_backup_{datetime.now().strftime('%Y%m%d%H%M%S')}{ext}"
+            shutil.copy2(self.current_file, backup_file)
+            self.logger.info(f"Created backup of Excel file: {backup_file}")
             
             # Save updated file
-            self.current_data.to_excel(self.current_file, index=False)
+            data.to_excel(self.current_file, index=False)
+            self._dirty = False
             self.logger.info(f"Updated processing status in Excel file: {self.current_file}")
             
+            # Re-key the cache so the written data is reused on the next load
+            self._cache_store(self.current_file, data)
+            
             return True
             
         except Exception as e:
@@ -1,11 +1,19 @@
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext, simpledialog
+from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
-import threading
 import queue
 import time
-from datetime import datetime
 import json
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# orjson formats large job results in C; fall back to the json module when absent
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Import our modules
 from logger import LoggerSetup, LogPanel
@@ -16,9 +24,156 @@ from processor import Processor
 from queue_manager import QueueManager
 from watcher import DirectoryWatcher
 
+# Job results of these types are shown as indented JSON, streamed into the view
+_JSON_RESULT_TYPES = frozenset((dict, list))
+
+# Text for other job result types, looked up by exact type; anything else uses str()
+_RESULT_FORMATTERS = {
+    str: lambda result: result,
+    bytes: lambda result: result.decode("utf-8", "replace"),
+}
+
+def _job_duration_key(job):
+    """Sort key for the duration column; jobs that never started come first"""
+    seconds = job.get_duration_seconds()
+    return -1.0 if seconds is None else seconds
+
+# Job list columns sorted on a job attribute rather than the displayed text
+_JOB_SORT_KEYS = {
+    "added": lambda job: job.added_time,
+    "duration": _job_duration_key,
+}
+
+class SelectWindowDialog(tk.Toplevel):
+    """Non-modal dialog listing active EZCAD instances to choose from"""
+
+    def __init__(self, parent, instances, on_select):
+        """Create the dialog and fill it with the given instances"""
+        super().__init__(parent)
+        self.title("Select EZCAD Window")
+        self.geometry("500x300")
+        self.on_select = on_select
+        self._window_ids = {}  # tree iid -> window ID
+
+        # Closing only hides the dialog so it can be reused
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
+
+        ttk.Label(self, text="Select an EZCAD window:").pack(padx=10, pady=10)
+
+        columns = ("id", "file", "started")
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", selectmode="browse")
+        self.tree.heading("id", text="Window ID")
+        self.tree.heading("file", text="EZD File")
+        self.tree.heading("started", text="Started")
+        self.tree.column("id", width=150)
+        self.tree.column("file", width=220)
+        self.tree.column("started", width=80)
+        self.tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.tree.bind("<Double-1>", lambda event: self._select())
+
+        # Buttons
+        button_frame = ttk.Frame(self)
+        button_frame.pack(fill=tk.X, padx=10, pady=10)
+
+        ttk.Button(button_frame, text="Select", command=self._select).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.withdraw).pack(side=tk.RIGHT, padx=5)
+
+        self.show(instances)
+
+    def show(self, instances):
+        """Replace the listed instances and bring the dialog to the front"""
+        self.tree.delete(*self.tree.get_children())
+        self._window_ids = {}
+        for window_id, info in instances.items():
+            ezd_file = info.get('ezd_file')
+            start_time = info.get('start_time')
+            iid = self.tree.insert("", tk.END, values=(
+                window_id,
+                os.path.basename(ezd_file) if ezd_file else "Unknown",
+                time.strftime("%H:%M:%S", time.localtime(start_time)) if start_time else ""
+            ))
+            self._window_ids[iid] = window_id
+
+        self.deiconify()
+        self.lift()
+
+    def _select(self):
+        """Hand the selected window ID to the callback"""
+        selection = self.tree.selection()
+        if not selection:
+            messagebox.showerror("Error", "Please select a window", parent=self)
+            return
+
+        self.withdraw()
+        self.on_select(self._window_ids[selection[0]])
+
 class EZCADAutomationApp:
     """The main EZCAD Automation application"""
 
+    # (Tk variable attribute, section, key, default, type) for each setting
+    # shown in the UI; drives both _refresh_from_config and _apply_settings
+    _CONFIG_BINDINGS = [
+        ("ezcad_exe_var", "Paths", "ezcad_exe", "", str),
+        ("watch_dir_var", "Monitoring", "watch_directory", "", str),
+        ("auto_start_var", "Settings", "auto_start", False, bool),
+        ("minimize_var", "Settings", "minimize_on_start", False, bool),
+        ("monitor_enabled_var", "Monitoring", "enabled", False, bool),
+        ("recursive_var", "Monitoring", "recursive", False, bool),
+        ("process_existing_var", "Monitoring", "process_existing", False, bool),
+        ("auto_trigger_var", "Settings", "auto_trigger", False, bool),
+        ("batch_process_var", "Settings", "batch_process", False, bool),
+        ("multiple_instances_var", "Settings", "multiple_instances", False, bool),
+        ("max_concurrent_var", "Settings", "max_concurrent_processes", 1, int),
+        ("excel_pattern_var", "Settings", "file_pattern_excel", "*.xls;*.xlsx", str),
+        ("ezd_pattern_var", "Settings", "file_pattern_ezd", "*.ezd", str),
+    ]
+
+    # Delay before writing config changes made by browse/monitor handlers
+    SAVE_DELAY_MS = 500
+
+    # Longest wait for teardown steps before the window is destroyed anyway
+    SHUTDOWN_TIMEOUT = 15
+
+    # Characters inserted per idle slice when streaming large job results
+    STREAM_CHUNK_CHARS = 16 * 1024
+
+    # File type filters for the Browse dialogs
+    EXE_FILETYPES = (("EZCAD2", "EZCAD2.exe"),)
+    EXCEL_FILETYPES = (("Excel files", "*.xls;*.xlsx"), ("All files", "*.*"))
+    EZD_FILETYPES = (("EZD files", "*.ezd"), ("All files", "*.*"))
+
+    # Job tree (column, heading, width), in the order of the values written by _refresh_job_list
+    JOB_COLUMN_SPECS = (
+        ("id", "Job ID", 100),
+        ("file", "File", 250),
+        ("type", "Type", 80),
+        ("status", "Status", 100),
+        ("added", "Added", 150),
+        ("duration", "Duration", 100),
+    )
+    JOB_COLUMNS = tuple(spec[0] for spec in JOB_COLUMN_SPECS)
+
+    # Window for coalescing job change bursts, and refresh rate while jobs run
+    REFRESH_DEBOUNCE_MS = 30
+    RUNNING_REFRESH_MS = 1000
+
+    # Latest jobs kept in the Jobs tab, and how many more to load on scroll
+    JOBS_WINDOW_SIZE = 500
+
+    # Rows shown in the Excel preview; only these are read from the workbook
+    PREVIEW_ROWS = 50
+
+    # Longest text put into the preview widget
+    PREVIEW_MAX_CHARS = 200_000
+
+    # Buffered file events flushed at once, and lines kept in the events view
+    EVENT_BUFFER_SIZE = 500
+    EVENT_FLUSH_MS = 100
+    EVENT_MAX_LINES = 2000
+
+    # Most worker-posted UI callbacks run per Tk event
+    UI_BATCH_SIZE = 64
+
     def __init__(self, root):
         """Initialize the application"""
         self.root = root
@@ -38,7 +193,38 @@ class EZCADAutomationApp:
         self.ezcad_controller = EZCADController(self.config, self.logger)
         self.processor = Processor(self.excel_handler, self.ezcad_controller, self.config, self.logger)
         self.queue_manager = QueueManager(self.processor, self.config, self.logger)
-        self.directory_watcher = DirectoryWatcher(self.config, self.queue_manager.file_queue, self.logger)
+        self.directory_watcher = DirectoryWatcher(self.config, self.queue_manager, self.logger, on_event=self._on_watcher_event)
+
+        # Callbacks posted by worker threads, run together on the Tk thread
+        self._ui_queue = queue.SimpleQueue()
+        self._ui_drain_pending = False
+        # Set once exit starts; late callbacks must not touch a dying root
+        self._closing = False
+
+        # Shared worker pool for background UI actions (loading, launching, processing)
+        self._executor_size = None
+        self._executor = None
+        self._resize_executor()
+
+        # Pending debounced config save; writes run in order on their own thread
+        self._save_after_id = None
+        self._config_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ezcad-config")
+
+        # EZCAD window that RED/MARK commands go to, once one is started or selected
+        self.current_window_id = None
+
+        # Reused window selection and job details dialogs
+        self._select_window_dialog = None
+        self._details_window = None
+        self._details_job = None
+        self._details_rendered_id = None
+        self._details_chunks = None
+
+        # Job list refreshes are pushed by the queue and coalesced
+        self._refresh_pending = False
+        self._refresh_forced = False  # Pending refresh must run even without job changes
+        self._duration_tick_id = None
+        self.queue_manager.on_change(self._on_jobs_changed)
 
         # Setup the UI
         self._create_ui()
@@ -53,28 +239,28 @@ class EZCADAutomationApp:
     def _create_ui(self):
         """Create the application UI"""
         # Create a notebook (tabbed interface)
+        # Variables and view state exist before any tab is built
+        self._create_variables()
+        self._create_styles()
+
         notebook = ttk.Notebook(self.root)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.notebook = notebook
 
         # Create main tab
         main_tab = ttk.Frame(notebook)
         notebook.add(main_tab, text="Main")
         self._create_main_tab(main_tab)
 
-        # Create monitoring tab
-        monitor_tab = ttk.Frame(notebook)
-        notebook.add(monitor_tab, text="Monitoring")
-        self._create_monitor_tab(monitor_tab)
-
-        # Create jobs tab
-        jobs_tab = ttk.Frame(notebook)
-        notebook.add(jobs_tab, text="Jobs")
-        self._create_jobs_tab(jobs_tab)
-
-        # Create settings tab
-        settings_tab = ttk.Frame(notebook)
-        notebook.add(settings_tab, text="Settings")
-        self._create_settings_tab(settings_tab)
+        # Monitoring, Jobs and Settings are built the first time they are shown
+        self._tab_builders = {}
+        for text, builder in (("Monitoring", self._create_monitor_tab),
+                              ("Jobs", self._create_jobs_tab),
+                              ("Settings", self._create_settings_tab)):
+            tab = ttk.Frame(notebook)
+            notebook.add(tab, text=text)
+            self._tab_builders[str(tab)] = builder
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Create log tab
         log_tab = ttk.Frame(notebook)
@@ -86,6 +272,7 @@ class EZCADAutomationApp:
         status_frame.pack(fill=tk.X, padx=10, pady=5)
 
         self.status_var = tk.StringVar(value="Ready")
+        self._status_text = "Ready"  # Last text written to status_var
         status_label = ttk.Label(status_frame, textvariable=self.status_var)
         status_label.pack(side=tk.LEFT)
 
@@ -94,32 +281,96 @@ class EZCADAutomationApp:
         clock_label = ttk.Label(status_frame, textvariable=self.clock_var)
         clock_label.pack(side=tk.RIGHT)
 
+        # Slow the clock down while the window is iconified
+        self._visible = True
+        self._last_tick = None
+        self._clock_after_id = None
+        self.root.bind("<Map>", self._on_map_change, add="+")
+        self.root.bind("<Unmap>", self._on_map_change, add="+")
+
         # Start the clock update
         self._update_clock()
 
+    def _create_styles(self):
+        """Define the named ttk styles shared by the job and profile dialogs"""
+        style = ttk.Style(self.root)
+        style.configure("Dialog.TLabel", padding=5)
+        style.configure("Dialog.TButton", padding=4)
+
+    def _create_variables(self):
+        """Create the Tk variables and view state shared by all tabs"""
+        # Paths
+        self.ezcad_exe_var = tk.StringVar()
+        self.excel_path_var = tk.StringVar()
+        self.ezd_path_var = tk.StringVar()
+
+        # Monitoring
+        self.watch_dir_var = tk.StringVar()
+        self.monitor_enabled_var = tk.BooleanVar(value=False)
+        self.recursive_var = tk.BooleanVar(value=False)
+        self.process_existing_var = tk.BooleanVar(value=False)
+        self.auto_trigger_var = tk.BooleanVar(value=False)
+        self.excel_pattern_var = tk.StringVar(value="*.xls;*.xlsx")
+        self.ezd_pattern_var = tk.StringVar(value="*.ezd")
+        self._monitoring_active = False
+        self.start_monitoring_button = None
+        self.stop_monitoring_button = None
+        self.events_text = None
+
+        # Pending event lines, written to the widget in one go
+        self._event_buf = deque(maxlen=self.EVENT_BUFFER_SIZE)
+        self._event_flush_pending = False
+
+        # (second, timestamp string) of the last event, reused within the same second;
+        # one tuple so watcher threads never see a mismatched pair
+        self._last_ts = (0, "")
+
+        # Jobs
+        self._jobs_window_var = tk.IntVar(value=self.JOBS_WINDOW_SIZE)
+        self.job_tree = None
+
+        # Values last written to each job row; rows use the job ID as their iid
+        self._job_rows = {}
+
+        # Active (column, descending) sort of the job list, or None for queue order
+        self._job_sort = None
+
+        # Shown jobs by ID as of the last refresh
+        self._job_cache = {}
+
+        # Queue manager job version the job list last rendered
+        self._jobs_seen_version = None
+
+        # Settings
+        self.auto_start_var = tk.BooleanVar(value=False)
+        self.minimize_var = tk.BooleanVar(value=False)
+        self.multiple_instances_var = tk.BooleanVar(value=False)
+        self.batch_process_var = tk.BooleanVar(value=False)
+        self.max_concurrent_var = tk.StringVar(value="1")
+        self.profile_name_var = tk.StringVar()
+
+    def _on_tab_changed(self, event):
+        """Build a lazily created tab the first time it is selected"""
+        tab = self.notebook.select()
+        builder = self._tab_builders.pop(tab, None)
+        if builder:
+            builder(self.notebook.nametowidget(tab))
+
     def _create_main_tab(self, parent):
         """Create the main tab content"""
         # EZCAD2.exe selection
         path_frame = ttk.LabelFrame(parent, text="Paths")
         path_frame.pack(fill=tk.X, padx=10, pady=10)
 
-        # EZCAD2.exe
-        ttk.Label(path_frame, text="EZCAD2.exe:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        self.ezcad_exe_var = tk.StringVar()
-        ttk.Entry(path_frame, textvariable=self.ezcad_exe_var, width=60).grid(row=0, column=1, padx=5, pady=5)
-        ttk.Button(path_frame, text="Browse", command=self._select_ezcad_exe).grid(row=0, column=2, padx=5, pady=5)
-
-        # Excel file
-        ttk.Label(path_frame, text="Excel File:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
-        self.excel_path_var = tk.StringVar()
-        ttk.Entry(path_frame, textvariable=self.excel_path_var, width=60).grid(row=1, column=1, padx=5, pady=5)
-        ttk.Button(path_frame, text="Browse", command=self._select_excel).grid(row=1, column=2, padx=5, pady=5)
-
-        # EZD file
-        ttk.Label(path_frame, text="EZD File:").grid(row=2, column=0, sticky="w", padx=5, pady=5)
-        self.ezd_path_var = tk.StringVar()
-        ttk.Entry(path_frame, textvariable=self.ezd_path_var, width=60).grid(row=2, column=1, padx=5, pady=5)
-        ttk.Button(path_frame, text="Browse", command=self._select_ezd).grid(row=2, column=2, padx=5, pady=5)
+        # (label, variable, browse command) for each path row
+        path_rows = [
+            ("EZCAD2.exe:", self.ezcad_exe_var, self._select_ezcad_exe),
+            ("Excel File:", self.excel_path_var, self._select_excel),
+            ("EZD File:", self.ezd_path_var, self._select_ezd),
+        ]
+        browse_buttons = [self._add_path_row(path_frame, row, label, var, browse_cmd)
+                          for row, (label, var, browse_cmd) in enumerate(path_rows)]
+        self._excel_browse_button = browse_buttons[1]
 
         # Excel preview
         preview_frame = ttk.LabelFrame(parent, text="Excel Preview")
@@ -148,6 +399,14 @@ class EZCADAutomationApp:
         self.select_window_button = ttk.Button(control_frame, text="Select EZCAD Window", command=self._select_ezcad_window)
         self.select_window_button.pack(side=tk.LEFT, padx=5)
 
+    def _add_path_row(self, parent, row, label, var, browse_cmd):
+        """Grid a label, path entry and Browse button on one row"""
+        ttk.Label(parent, text=label).grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        ttk.Entry(parent, textvariable=var, width=60).grid(row=row, column=1, padx=5, pady=5)
+        button = ttk.Button(parent, text="Browse", command=browse_cmd)
+        button.grid(row=row, column=2, padx=5, pady=5)
+        return button
+
     def _create_monitor_tab(self, parent):
         """Create the monitoring tab content"""
         # Watch directory frame
@@ -155,24 +414,20 @@ class EZCADAutomationApp:
         watch_frame.pack(fill=tk.X, padx=10, pady=10)
 
         # Watch directory
-        ttk.Label(watch_frame, text="Watch Directory:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        self.watch_dir_var = tk.StringVar()
-        ttk.Entry(watch_frame, textvariable=self.watch_dir_var, width=60).grid(row=0, column=1, padx=5, pady=5)
-        ttk.Button(watch_frame, text="Browse", command=self._select_watch_dir).grid(row=0, column=2, padx=5, pady=5)
+        self._add_path_row(watch_frame, 0, "Watch Directory:", self.watch_dir_var, self._select_watch_dir)
 
         # Monitoring options
         options_frame = ttk.Frame(watch_frame)
         options_frame.grid(row=1, column=0, columnspan=3, sticky="w", padx=5, pady=5)
 
-        self.monitor_enabled_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(options_frame, text="Enable Monitoring", variable=self.monitor_enabled_var).pack(side=tk.LEFT, padx=5)
 
-        self.recursive_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(options_frame, text="Include Subdirectories", variable=self.recursive_var).pack(side=tk.LEFT, padx=5)
 
-        self.auto_trigger_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(options_frame, text="Auto-Trigger Processing", variable=self.auto_trigger_var).pack(side=tk.LEFT, padx=5)
 
+        ttk.Checkbutton(options_frame, text="Process Existing Files", variable=self.process_existing_var).pack(side=tk.LEFT, padx=5)
+
         # Control buttons
         monitor_control_frame = ttk.Frame(watch_frame)
         monitor_control_frame.grid(row=2, column=0, columnspan=3, sticky="w", padx=5, pady=5)
@@ -182,17 +437,16 @@ class EZCADAutomationApp:
 
         self.stop_monitoring_button = ttk.Button(monitor_control_frame, text="Stop Monitoring", command=self._stop_monitoring, state=tk.DISABLED)
         self.stop_monitoring_button.pack(side=tk.LEFT, padx=5)
+        self._set_monitoring_buttons(self._monitoring_active)
 
         # File patterns
         patterns_frame = ttk.LabelFrame(parent, text="File Patterns")
         patterns_frame.pack(fill=tk.X, padx=10, pady=10)
 
         ttk.Label(patterns_frame, text="Excel Files:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        self.excel_pattern_var = tk.StringVar(value="*.xls;*.xlsx")
         ttk.Entry(patterns_frame, textvariable=self.excel_pattern_var).grid(row=0, column=1, sticky="ew", padx=5, pady=5)
 
         ttk.Label(patterns_frame, text="EZD Files:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
-        self.ezd_pattern_var = tk.StringVar(value="*.ezd")
         ttk.Entry(patterns_frame, textvariable=self.ezd_pattern_var).grid(row=1, column=1, sticky="ew", padx=5, pady=5)
 
         patterns_frame.columnconfigure(1, weight=1)
@@ -205,6 +459,9 @@ class EZCADAutomationApp:
         self.events_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.events_text.config(state=tk.DISABLED)
 
+        # Show events that arrived before the tab was built
+        self._flush_events()
+
     def _create_jobs_tab(self, parent):
         """Create the jobs tab content"""
         # Job queue controls
@@ -214,30 +471,24 @@ class EZCADAutomationApp:
         ttk.Button(controls_frame, text="Start Processing", command=self._start_processing).pack(side=tk.LEFT, padx=5)
         ttk.Button(controls_frame, text="Stop Processing", command=self._stop_processing).pack(side=tk.LEFT, padx=5)
         ttk.Button(controls_frame, text="Clear Completed", command=self._clear_completed_jobs).pack(side=tk.LEFT, padx=5)
-        ttk.Button(controls_frame, text="Refresh", command=self._refresh_job_list).pack(side=tk.LEFT, padx=5)
+        ttk.Button(controls_frame, text="Refresh", command=lambda: self._schedule_refresh(force=True)).pack(side=tk.LEFT, padx=5)
+
+        # Number of latest jobs shown
+        ttk.Spinbox(controls_frame, from_=50, to=100000, increment=50, width=8,
+                    textvariable=self._jobs_window_var, command=lambda: self._schedule_refresh(force=True)).pack(side=tk.RIGHT, padx=5)
+        ttk.Label(controls_frame, text="Show latest:").pack(side=tk.RIGHT)
 
         # Job list
         job_frame = ttk.Frame(parent)
         job_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Create treeview for jobs
-        columns = ("id", "file", "type", "status", "added", "duration")
-        self.job_tree = ttk.Treeview(job_frame, columns=columns, show="headings")
-
-        # Configure columns
-        self.job_tree.heading("id", text="Job ID")
-        self.job_tree.heading("file", text="File")
-        self.job_tree.heading("type", text="Type")
-        self.job_tree.heading("status", text="Status")
-        self.job_tree.heading("added", text="Added")
-        self.job_tree.heading("duration", text="Duration")
-
-        self.job_tree.column("id", width=100)
-        self.job_tree.column("file", width=250)
-        self.job_tree.column("type", width=80)
-        self.job_tree.column("status", width=100)
-        self.job_tree.column("added", width=150)
-        self.job_tree.column("duration", width=100)
+        self.job_tree = ttk.Treeview(job_frame, columns=self.JOB_COLUMNS, show="headings")
+
+        # Configure columns; clicking a heading sorts by that column
+        for column, heading, width in self.JOB_COLUMN_SPECS:
+            self.job_tree.heading(column, text=heading, command=lambda c=column: self._sort_jobs_by(c))
+            self.job_tree.column(column, width=width)
 
         # Add scrollbar
         job_scroll = ttk.Scrollbar(job_frame, orient=tk.VERTICAL, command=self.job_tree.yview)
@@ -247,12 +498,24 @@ class EZCADAutomationApp:
         self.job_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         job_scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
+        # Context menu, built once; its commands act on the job last right-clicked
+        self._menu_job_id = None
+        self._job_menu = tk.Menu(self.root, tearoff=0)
+        self._job_menu.add_command(label="View Details", command=lambda: self._show_job_details_by_id(self._menu_job_id))
+        self._job_menu.add_command(label="Cancel Job", command=lambda: self._cancel_job(self._menu_job_id))
+
         # Bind right-click for context menu
         self.job_tree.bind("<Button-3>", self._show_job_context_menu)
 
         # Bind double-click for job details
         self.job_tree.bind("<Double-1>", self._show_job_details)
 
+        # Scrolling up at the top loads older jobs
+        self.job_tree.bind("<MouseWheel>", self._on_jobs_scroll, add="+")
+        self.job_tree.bind("<Button-4>", self._on_jobs_scroll, add="+")
+
+        self._refresh_job_list()
+
     def _create_settings_tab(self, parent):
         """Create the settings tab content"""
         # General settings
@@ -260,19 +523,15 @@ class EZCADAutomationApp:
         general_frame.pack(fill=tk.X, padx=10, pady=10)
 
         # Auto-start
-        self.auto_start_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(general_frame, text="Auto-Start Processing on Launch", variable=self.auto_start_var).grid(row=0, column=0, sticky="w", padx=5, pady=5)
 
         # Minimize on start
-        self.minimize_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(general_frame, text="Minimize EZCAD After Launch", variable=self.minimize_var).grid(row=1, column=0, sticky="w", padx=5, pady=5)
 
         # Multiple instances
-        self.multiple_instances_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(general_frame, text="Allow Multiple EZCAD Instances", variable=self.multiple_instances_var).grid(row=2, column=0, sticky="w", padx=5, pady=5)
 
         # Batch processing
-        self.batch_process_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(general_frame, text="Batch Processing", variable=self.batch_process_var).grid(row=3, column=0, sticky="w", padx=5, pady=5)
 
         # Concurrency
@@ -281,7 +540,6 @@ class EZCADAutomationApp:
 
         ttk.Label(concurrency_frame, text="Max Concurrent Processes:").pack(side=tk.LEFT)
 
-        self.max_concurrent_var = tk.StringVar(value="1")
         concurrency_spin = ttk.Spinbox(concurrency_frame, from_=1, to=5, width=5, textvariable=self.max_concurrent_var)
         concurrency_spin.pack(side=tk.LEFT, padx=5)
 
@@ -295,7 +553,6 @@ class EZCADAutomationApp:
 
         ttk.Label(profile_controls, text="Profile Name:").pack(side=tk.LEFT, padx=5)
 
-        self.profile_name_var = tk.StringVar()
         ttk.Entry(profile_controls, textvariable=self.profile_name_var, width=20).pack(side=tk.LEFT, padx=5)
 
         ttk.Button(profile_controls, text="Save Profile", command=self._save_profile).pack(side=tk.LEFT, padx=5)
@@ -323,125 +580,223 @@ class EZCADAutomationApp:
         ttk.Button(controls_frame, text="Clear Log", command=self.log_panel.clear).pack(side=tk.LEFT, padx=5)
         ttk.Button(controls_frame, text="Open Log Directory", command=self._open_log_directory).pack(side=tk.LEFT, padx=5)
 
+    def _on_map_change(self, event):
+        """Track whether the main window is shown or iconified"""
+        # Child widgets propagate Map/Unmap through the root bindtag
+        if event.widget is self.root:
+            was_visible = self._visible
+            self._visible = event.type == tk.EventType.Map
+            if self._visible and not was_visible:
+                # Don't wait out the slow idle tick after a restore
+                if self._clock_after_id:
+                    self.root.after_cancel(self._clock_after_id)
+                self._update_clock()
+
     def _update_clock(self):
         """Update the clock in the status bar"""
-        self.clock_var.set(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        self.root.after(1000, self._update_clock)
-
-    def _refresh_from_config(self):
-        """Refresh UI elements from the config"""
-        # Paths
-        self.ezcad_exe_var.set(self.config.get('Paths', 'ezcad_exe', ''))
-        self.watch_dir_var.set(self.config.get('Monitoring', 'watch_directory', ''))
+        if not self._visible:
+            # Nobody can see the clock; just check back now and then
+            self._clock_after_id = self.root.after(5000, self._update_clock)
+            return
 
-        # Settings
-        self.auto_start_var.set(self.config.getboolean('Settings', 'auto_start', False))
-        self.minimize_var.set(self.config.getboolean('Settings', 'minimize_on_start', False))
-        self.monitor_enabled_var.set(self.config.getboolean('Monitoring', 'enabled', False))
-        self.recursive_var.set(self.config.getboolean('Monitoring', 'recursive', False))
-        self.auto_trigger_var.set(self.config.getboolean('Settings', 'auto_trigger', False))
-        self.batch_process_var.set(self.config.getboolean('Settings', 'batch_process', False))
-        self.multiple_instances_var.set(self.config.getboolean('Settings', 'multiple_instances', False))
+        now = time.time()
+        second = int(now)
+        if second != self._last_tick:
+            self._last_tick = second
+            self.clock_var.set(time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
 
-        self.max_concurrent_var.set(str(self.config.getint('Settings', 'max_concurrent_processes', 1)))
+        # Wake up just after the next wall-clock second instead of drifting
+        self._clock_after_id = self.root.after(1000 - int((now - second) * 1000), self._update_clock)
 
-        # File patterns
-        self.excel_pattern_var.set(self.config.get('Settings', 'file_pattern_excel', '*.xls;*.xlsx'))
-        self.ezd_pattern_var.set(self.config.get('Settings', 'file_pattern_ezd', '*.ezd'))
+    def _refresh_from_config(self):
+        """Refresh UI elements from the config"""
+        # Read every section once instead of one lookup per option
+        cfg = self.config.snapshot()
+        for name, section, key, default, cast in self._CONFIG_BINDINGS:
+            raw = cfg.get(section, {}).get(key)
+            getattr(self, name).set(self._cfg_read(raw, default, cast))
+
+    @staticmethod
+    def _cfg_read(raw, default, cast):
+        """Convert a raw config string to the type a Tk variable expects"""
+        if cast is bool:
+            return ConfigManager.to_bool(raw, default)
+        if cast is int:
+            return ConfigManager.to_int(raw, default)
+        return default if raw is None else raw
 
     def _apply_settings(self):
         """Apply settings from UI to config"""
-        # Paths
-        self.config.set('Paths', 'ezcad_exe', self.ezcad_exe_var.get())
-        self.config.set('Monitoring', 'watch_directory', self.watch_dir_var.get())
-
-        # Settings
-        self.config.set('Settings', 'auto_start', str(self.auto_start_var.get()))
-        self.config.set('Settings', 'minimize_on_start', str(self.minimize_var.get()))
-        self.config.set('Monitoring', 'enabled', str(self.monitor_enabled_var.get()))
-        self.config.set('Monitoring', 'recursive', str(self.recursive_var.get()))
-        self.config.set('Settings', 'auto_trigger', str(self.auto_trigger_var.get()))
-        self.config.set('Settings', 'batch_process', str(self.batch_process_var.get()))
-        self.config.set('Settings', 'multiple_instances', str(self.multiple_instances_var.get()))
-
-        self.config.set('Settings', 'max_concurrent_processes', self.max_concurrent_var.get())
-
-        # File patterns
-        self.config.set('Settings', 'file_pattern_excel', self.excel_pattern_var.get())
-        self.config.set('Settings', 'file_pattern_ezd', self.ezd_pattern_var.get())
+        # Reject a concurrency the pool could not be sized from before anything is saved
+        max_concurrent = ConfigManager.to_int(self.max_concurrent_var.get(), None)
+        if max_concurrent is None or max_concurrent < 1:
+            messagebox.showerror("Settings", "Max concurrent processes must be a whole number of at least 1")
+            return
 
-        # Save the config
-        self.config.save_config()
+        # Write all values and save the file once
+        values = {}
+        for name, section, key, default, cast in self._CONFIG_BINDINGS:
+            values.setdefault(section, {})[key] = getattr(self, name).get()
+        self.config.update(values, save=False)
+        self._do_save()
+        self._resize_executor()
+        self._update_watch_patterns()
 
         self.logger.info("Settings applied and saved")
-        messagebox.showinfo("Settings", "Settings applied and saved")
+        self._set_status("Settings applied and saved")
+        if not self.config.getboolean('Settings', 'batch_process', False):
+            messagebox.showinfo("Settings", "Settings applied and saved")
+
+    def _resize_executor(self):
+        """(Re)create the worker pool when max_concurrent_processes changes"""
+        # Room for the configured processing plus preview loads and commands
+        size = max(1, ConfigManager.to_int(self.config.get('Settings', 'max_concurrent_processes'), 1)) + 2
+        if size == self._executor_size:
+            return
+        old_executor = self._executor
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="ezcad-bg")
+        self._executor_size = size
+        if old_executor is not None:
+            # Work already submitted still runs on the old pool
+            old_executor.shutdown(wait=False)
+            self.logger.info(f"Worker pool resized to {size} threads")
 
     def _reset_settings(self):
         """Reset settings to default"""
         if messagebox.askyesno("Reset Settings", "Are you sure you want to reset all settings to default?"):
             # Create a new default config
-            self.config._create_default_config()
+            self.config._create_default_config(save=False)
+            self._do_save()
             # Refresh UI
             self._refresh_from_config()
             self.logger.info("Settings reset to default")
 
+    def _post_ui(self, func, *args):
+        """Run func(*args) on the Tk thread; safe to call from any thread"""
+        if self._closing:
+            return
+        self._ui_queue.put((func, args))
+        # One idle callback serves everything posted until the drain runs;
+        # running at idle time keeps it from competing with pending redraws
+        if not self._ui_drain_pending:
+            self._ui_drain_pending = True
+            self.root.after_idle(self._drain_ui_queue)
+
+    def _drain_ui_queue(self):
+        """Run callbacks posted by worker threads, a batch at a time"""
+        self._ui_drain_pending = False
+        for _ in range(self.UI_BATCH_SIZE):
+            try:
+                func, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                func(*args)
+            except Exception as e:
+                self.logger.error(f"Error in UI callback {func.__name__}: {str(e)}")
+
+        # More may be waiting; continue once pending Tk events have run
+        self._ui_drain_pending = True
+        self.root.after(1, self._drain_ui_queue)
+
+    def _schedule_save(self):
+        """Save the config once the current burst of changes settles"""
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(self.SAVE_DELAY_MS, self._do_save)
+
+    def _do_save(self):
+        """Write any pending config changes to disk off the Tk thread"""
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        # Render on the Tk thread so the writer never sees a half-updated config
+        text = self.config.take_pending_save()
+        if text is not None:
+            self._config_writer.submit(self._write_config, text)
+
+    def _write_config(self, text):
+        """Write rendered config text (runs on the config writer thread)"""
+        try:
+            self.config.write_config_text(text)
+        except OSError as e:
+            self.logger.error(f"Error saving config: {str(e)}")
+
     def _select_ezcad_exe(self):
         """Browse for EZCAD2.exe"""
         file_path = filedialog.askopenfilename(
-            title="Select EZCAD2.exe", 
-            filetypes=[("EZCAD2", "EZCAD2.exe")]
+            title="Select EZCAD2.exe",
+            filetypes=self.EXE_FILETYPES,
+            initialdir=os.path.dirname(self.ezcad_exe_var.get()) or None
         )
         if file_path:
             self.ezcad_exe_var.set(file_path)
             self.config.set('Paths', 'ezcad_exe', file_path)
-            self.config.save_config()
+            self._schedule_save()
             self.logger.info(f"EZCAD2.exe path set: {file_path}")
 
     def _select_excel(self):
         """Browse for Excel file"""
         file_path = filedialog.askopenfilename(
             title="Select Excel File",
-            filetypes=[("Excel files", "*.xls;*.xlsx")]
+            filetypes=self.EXCEL_FILETYPES,
+            initialdir=self.config.get('Paths', 'last_excel_dir') or None
         )
         if file_path:
             self.excel_path_var.set(file_path)
             self.config.set('Paths', 'last_excel_file', file_path)
             self.config.set('Paths', 'last_excel_dir', os.path.dirname(file_path))
-            self.config.save_config()
-
-            # Load and preview Excel
-            df = self.excel_handler.load_excel(file_path)
-            if df is not None:
-                preview = self.excel_handler.get_preview()
-
-                self.preview_text.config(state=tk.NORMAL)
-                self.preview_text.delete(1.0, tk.END)
-                self.preview_text.insert(tk.END, preview)
-                self.preview_text.config(state=tk.DISABLED)
+            self._schedule_save()
+
+            # Preview only the first rows; the full load happens when processing
+            self._excel_browse_button.state(["disabled"])
+            self._set_status("Loading Excel preview...")
+            future = self._executor.submit(self.excel_handler.load_preview, file_path, self.PREVIEW_ROWS)
+            future.add_done_callback(lambda f: self._post_ui(self._on_preview_loaded, file_path, f))
+
+    def _on_preview_loaded(self, file_path, future):
+        """Show the Excel preview once the background read finishes"""
+        self._excel_browse_button.state(["!disabled"])
+        self._set_status("Ready")
+        preview = future.result()
+        # Ignore results for a file that is no longer selected
+        if preview is not None and file_path == self.excel_path_var.get():
+            self.logger.info(f"Excel file selected: {file_path}")
+            self._set_preview(preview)
+
+    def _set_preview(self, text):
+        """Replace the Excel preview text"""
+        if len(text) > self.PREVIEW_MAX_CHARS:
+            text = text[:self.PREVIEW_MAX_CHARS] + "\n..."
+        self.preview_text.config(state=tk.NORMAL)
+        self.preview_text.delete(1.0, tk.END)
+        self.preview_text.insert(tk.END, text)
+        self.preview_text.config(state=tk.DISABLED)
 
     def _select_ezd(self):
         """Browse for EZD file"""
         file_path = filedialog.askopenfilename(
             title="Select EZD File",
-            filetypes=[("EZD files", "*.ezd")]
+            filetypes=self.EZD_FILETYPES,
+            initialdir=self.config.get('Paths', 'last_ezd_dir') or None
         )
         if file_path:
             self.ezd_path_var.set(file_path)
             self.config.set('Paths', 'last_ezd_file', file_path)
             self.config.set('Paths', 'last_ezd_dir', os.path.dirname(file_path))
-            self.config.save_config()
+            self._schedule_save()
             self.logger.info(f"EZD file selected: {file_path}")
             # EZD dosyası seçilince butonları aktif yap
-            self.red_button.config(state=tk.NORMAL)
-            self.mark_button.config(state=tk.NORMAL)
+            self._enable_command_buttons()
 
     def _select_watch_dir(self):
         """Browse for directory to watch"""
-        dir_path = filedialog.askdirectory(title="Select Directory to Watch")
+        dir_path = filedialog.askdirectory(title="Select Directory to Watch",
+                                           initialdir=self.watch_dir_var.get() or None)
         if dir_path:
             self.watch_dir_var.set(dir_path)
             self.config.set('Monitoring', 'watch_directory', dir_path)
-            self.config.save_config()
+            self._schedule_save()
             self.logger.info(f"Watch directory set: {dir_path}")
 
     def _run_ezcad(self):
@@ -453,64 +808,67 @@ class EZCADAutomationApp:
 
         self.logger.info(f"Starting EZCAD with file: {ezd_file}")
 
-        # Start EZCAD in a separate thread
-        threading.Thread(target=self._run_ezcad_thread, args=(ezd_file,), daemon=True).start()
+        # Start EZCAD on the background pool and report back on the Tk thread
+        future = self._executor.submit(self.ezcad_controller.start_ezcad, ezd_file)
+        future.add_done_callback(lambda f: self._post_ui(self._on_ezcad_started, f))
 
-    def _run_ezcad_thread(self, ezd_file):
-        """Thread function to run EZCAD"""
+    def _on_ezcad_started(self, future):
+        """Enable EZCAD controls once the background start finishes"""
         try:
-            window_id = self.ezcad_controller.start_ezcad(ezd_file)
-
-            if window_id:
-                # Enable the control buttons
-                self.root.after(0, lambda: self.red_button.config(state=tk.NORMAL))
-                self.root.after(0, lambda: self.mark_button.config(state=tk.NORMAL))
+            window_id = future.result()
+        except Exception as e:
+            self.logger.error(f"Error starting EZCAD: {str(e)}")
+            messagebox.showerror("Error", f"Error starting EZCAD: {str(e)}")
+            return
 
-                # Store window ID for later use
-                self.current_window_id = window_id
+        if window_id:
+            # Store window ID for later use
+            self.current_window_id = window_id
+            self._enable_command_buttons()
 
-                self.logger.info(f"EZCAD started successfully with window ID: {window_id}")
-                self.root.after(0, lambda: self.status_var.set(f"EZCAD running - Window ID: {window_id}"))
-            else:
-                self.logger.error("Failed to start EZCAD")
-                self.root.after(0, lambda: messagebox.showerror("Error", "Failed to start EZCAD"))
+            self.logger.info(f"EZCAD started successfully with window ID: {window_id}")
+            self._set_status(f"EZCAD running - Window ID: {window_id}")
+        else:
+            self.logger.error("Failed to start EZCAD")
+            messagebox.showerror("Error", "Failed to start EZCAD")
 
-        except Exception as e:
-            self.logger.error(f"Error starting EZCAD: {str(e)}")
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Error starting EZCAD: {str(e)}"))
+    def _enable_command_buttons(self):
+        """Enable the RED and MARK command buttons"""
+        for button in (self.red_button, self.mark_button):
+            button.config(state=tk.NORMAL)
 
     def _send_command(self, command):
         """Send a command to the active EZCAD window"""
-        if not hasattr(self, 'current_window_id'):
+        if self.current_window_id is None:
             messagebox.showerror("Error", "No active EZCAD window")
             return
 
-        try:
-            # Show status
-            self.status_var.set(f"Sending {command} command...")
-            self.root.update_idletasks()
+        # Show status and send from the background pool so the UI stays responsive
+        self._set_status(f"Sending {command} command...")
+        future = self._executor.submit(self.ezcad_controller.send_command, self.current_window_id, command)
+        future.add_done_callback(lambda f: self._post_ui(self._on_cmd_done, command, f))
 
-            # Send command through the controller
-            success = self.ezcad_controller.send_command(self.current_window_id, command)
+    def _on_cmd_done(self, command, future):
+        """Report the result of a background EZCAD command"""
+        try:
+            if not future.result():
+                raise Exception("Command failed to send")
 
-            if success:
-                self.logger.info(f"Sent {command.upper()} command to EZCAD")
-                self.status_var.set(f"{command.upper()} command sent successfully")
+            self.logger.info(f"Sent {command.upper()} command to EZCAD")
+            self._set_status(f"{command.upper()} command sent successfully")
 
-                # Automatically handle any post-command tasks
-                if command.lower() == 'mark':
-                    self.logger.info("Mark operation completed")
-                    self.status_var.set("Mark operation completed")
-                elif command.lower() == 'red':
-                    self.logger.info("Red laser operation completed")
-                    self.status_var.set("Red laser operation completed")
-            else:
-                raise Exception("Command failed to send")
+            # Automatically handle any post-command tasks
+            if command.lower() == 'mark':
+                self.logger.info("Mark operation completed")
+                self._set_status("Mark operation completed")
+            elif command.lower() == 'red':
+                self.logger.info("Red laser operation completed")
+                self._set_status("Red laser operation completed")
 
         except Exception as e:
             self.logger.error(f"Failed to send {command.upper()} command: {str(e)}")
             messagebox.showerror("Error", f"Failed to send {command.upper()} command")
-            self.status_var.set("Command failed")
+            self._set_status("Command failed")
 
     def _process_excel(self):
         """Process the selected Excel file"""
@@ -520,9 +878,20 @@ class EZCADAutomationApp:
             return
 
         self.logger.info(f"Processing Excel file: {excel_file}")
+        future = self._executor.submit(self.processor.process_file, excel_file)
+        future.add_done_callback(lambda f: self._post_ui(self._on_excel_processed, f))
+
+    def _on_excel_processed(self, future):
+        """Report the result of a background Excel processing run"""
         try:
-            result = self.processor.process_file(excel_file)
-            messagebox.showinfo("Success", f"Excel file processed successfully.\nRows processed: {result.get('rows_processed', 0)}")
+            result = future.result()
+            rows = result.get('rows_processed', 0)
+            self.logger.info(f"Excel file processed: {rows} rows")
+            self._set_status(f"Processed {rows} rows")
+
+            # Only interrupt with a dialog when not running unattended
+            if not self.config.getboolean('Settings', 'batch_process', False):
+                messagebox.showinfo("Success", f"Excel file processed successfully.\nRows processed: {rows}")
         except Exception as e:
             self.logger.error(f"Failed to process Excel file: {str(e)}")
             messagebox.showerror("Error", f"Failed to process Excel file: {str(e)}")
@@ -540,47 +909,50 @@ class EZCADAutomationApp:
 
             # If there's only one instance, use it
             if len(instances) == 1:
-                self.current_window_id = list(instances.keys())[0]
-                self.red_button.config(state=tk.NORMAL)
-                self.mark_button.config(state=tk.NORMAL)
-                self.logger.info(f"Selected EZCAD window: {self.current_window_id}")
-                messagebox.showinfo("Success", "EZCAD window selected")
+                self._set_current_window(next(iter(instances)))
                 return
 
             # If multiple instances, let user select
-            window_list = "\n".join([f"{wid}: {info.get('ezd_file', 'Unknown')}" for wid, info in instances.items()])
-            messagebox.showinfo("Multiple Windows", f"Multiple EZCAD windows found:\n{window_list}\n\nPlease use one of these IDs in the next prompt.")
-
-            window_id = simpledialog.askstring("Select Window", "Enter window ID:")
-            if not window_id or window_id not in instances:
-                raise ValueError("Invalid window ID")
-
-            self.current_window_id = window_id
-            self.red_button.config(state=tk.NORMAL)
-            self.mark_button.config(state=tk.NORMAL)
-            self.logger.info(f"Selected EZCAD window: {self.current_window_id}")
-            messagebox.showinfo("Success", "EZCAD window selected")
+            dialog = self._select_window_dialog
+            if dialog is not None and dialog.winfo_exists():
+                dialog.show(instances)
+            else:
+                self._select_window_dialog = SelectWindowDialog(self.root, instances, on_select=self._set_current_window)
 
         except Exception as e:
             self.logger.error(f"Error selecting EZCAD window: {str(e)}")
             messagebox.showerror("Error", f"Error selecting EZCAD window: {str(e)}")
 
+    def _set_current_window(self, window_id):
+        """Make the given EZCAD window the target of Red/Mark commands"""
+        self.current_window_id = window_id
+        self._enable_command_buttons()
+        self.logger.info(f"Selected EZCAD window: {self.current_window_id}")
+        messagebox.showinfo("Success", "EZCAD window selected")
+
+    def _update_watch_patterns(self):
+        """Recompile the watcher's file patterns from the settings"""
+        self.directory_watcher.set_patterns(self.excel_pattern_var.get() + ';' + self.ezd_pattern_var.get())
+
     def _start_monitoring(self):
         """Start directory monitoring"""
         # Apply current settings
         self.config.set('Monitoring', 'enabled', 'true')
         self.config.set('Monitoring', 'watch_directory', self.watch_dir_var.get())
         self.config.set('Monitoring', 'recursive', str(self.recursive_var.get()))
+        self.config.set('Monitoring', 'process_existing', str(self.process_existing_var.get()))
         self.config.set('Settings', 'auto_trigger', str(self.auto_trigger_var.get()))
         self.config.set('Settings', 'file_pattern_excel', self.excel_pattern_var.get())
         self.config.set('Settings', 'file_pattern_ezd', self.ezd_pattern_var.get())
-        self.config.save_config()
+        self._schedule_save()
+
+        # Compile the file patterns once for all watcher events
+        self._update_watch_patterns()
 
         # Start the directory watcher
         if self.directory_watcher.start_watching():
-            self.start_monitoring_button.config(state=tk.DISABLED)
-            self.stop_monitoring_button.config(state=tk.NORMAL)
-            self.status_var.set("Monitoring active")
+            self._set_monitoring_buttons(True)
+            self._set_status("Monitoring active")
 
             # Start job processing if not already running
             if not self.queue_manager.should_run:
@@ -595,21 +967,58 @@ class EZCADAutomationApp:
         """Stop directory monitoring"""
         self.directory_watcher.stop_watching()
         self.config.set('Monitoring', 'enabled', 'false')
-        self.config.save_config()
+        self._schedule_save()
 
-        self.start_monitoring_button.config(state=tk.NORMAL)
-        self.stop_monitoring_button.config(state=tk.DISABLED)
-        self.status_var.set("Monitoring stopped")
+        self._set_monitoring_buttons(False)
+        self._set_status("Monitoring stopped")
 
         # Add log to events text
         self._add_event("Monitoring stopped")
 
+    def _set_monitoring_buttons(self, active):
+        """Remember the monitoring state and reflect it on the buttons if built"""
+        self._monitoring_active = active
+        if self.start_monitoring_button is not None:
+            self.start_monitoring_button.config(state=tk.DISABLED if active else tk.NORMAL)
+            self.stop_monitoring_button.config(state=tk.NORMAL if active else tk.DISABLED)
+
+    def _on_watcher_event(self, message):
+        """Forward a watcher event to the events view; runs on watcher and scan threads"""
+        self._post_ui(self._add_event, message)
+
     def _add_event(self, message):
-        """Add an event message to the events text"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        """Add an event message to the events text (Tk thread only)"""
+        now_s = int(time.time())
+        last_s, stamp = self._last_ts
+        if now_s != last_s:
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now_s))
+            self._last_ts = (now_s, stamp)
+        self._event_buf.append(f"{stamp}: {message}\n")
+
+        if not self._event_flush_pending:
+            self._event_flush_pending = True
+            self.root.after(self.EVENT_FLUSH_MS, self._flush_events)
+
+    def _flush_events(self):
+        """Write buffered event messages to the events text"""
+        self._event_flush_pending = False
+        # Keep buffering until the Monitoring tab has been built
+        if not self._event_buf or self.events_text is None:
+            return
+
+        # Pop only what is here now; the watcher may still be appending
+        lines = []
+        while True:
+            try:
+                lines.append(self._event_buf.popleft())
+            except IndexError:
+                break
+        blob = "".join(lines)
 
         self.events_text.config(state=tk.NORMAL)
-        self.events_text.insert(tk.END, f"{timestamp}: {message}\n")
+        self.events_text.insert(tk.END, blob)
+        # Keep only the most recent lines
+        self.events_text.delete("1.0", f"end-{self.EVENT_MAX_LINES}l")
         self.events_text.see(tk.END)
         self.events_text.config(state=tk.DISABLED)
 
@@ -618,7 +1027,7 @@ class EZCADAutomationApp:
         if not self.queue_manager.should_run:
             self.queue_manager.start_processing()
             self.logger.info("Job processing started")
-            self.status_var.set("Job processing active")
+            self._set_status("Job processing active")
         else:
             self.logger.info("Job processing already active")
 
@@ -627,37 +1036,132 @@ class EZCADAutomationApp:
         if self.queue_manager.should_run:
             self.queue_manager.stop_processing()
             self.logger.info("Job processing stopped")
-            self.status_var.set("Job processing stopped")
-
-    def _refresh_job_list(self):
-        """Refresh the job list display"""
-        # Clear current items
-        for item in self.job_tree.get_children():
-            self.job_tree.delete(item)
-
-        # Get all jobs and add to the treeview
-        for job in self.queue_manager.get_all_jobs():
-            # Calculate duration if applicable
-            duration = ""
-            if job.start_time and job.end_time:
-                duration = str(job.end_time - job.start_time).split('.')[0]  # Remove microseconds
-            elif job.start_time:
-                duration = str(datetime.now() - job.start_time).split('.')[0]
-
-            # Format the added time
-            added_time = job.added_time.strftime("%Y-%m-%d %H:%M:%S")
-
-            # Get the file name only, not the full path
-            file_name = os.path.basename(job.file_path)
-
-            self.job_tree.insert("", "end", values=(
+            self._set_status("Job processing stopped")
+
+    def _refresh_job_list(self, force=False):
+        """Refresh the job list display, skipping it when no job changed since the last one"""
+        if self.job_tree is None:
+            return
+
+        version = self.queue_manager.version
+        if version == self._jobs_seen_version and not force:
+            return
+        self._jobs_seen_version = version
+
+        # Only the latest jobs are kept in the tree; older ones are never walked
+        window = self.queue_manager.get_latest_jobs(self._get_jobs_window())
+        self._job_cache = {job.id: job for job in window}
+        seen = {job.id for job in window}
+
+        # Remove rows for jobs that are gone in a single Tk call
+        stale = [job_id for job_id in self._job_rows if job_id not in seen]
+        if stale:
+            self.job_tree.delete(*stale)
+            for job_id in stale:
+                del self._job_rows[job_id]
+
+        # Update changed rows and insert new jobs; untouched rows stay as they are
+        changed = False
+        for index, job in enumerate(window):
+            # Only running jobs have a duration that still changes
+            values = (
                 job.id,
-                file_name,
+                job.file_basename,
                 job.job_type,
                 job.status,
-                added_time,
-                duration
-            ))
+                job.added_time_str,
+                job.get_duration_str()
+            )
+
+            old_values = self._job_rows.get(job.id)
+            if old_values is None:
+                # Insert in place so older jobs pulled into the window land on top
+                self.job_tree.insert("", index, iid=job.id, values=values)
+                changed = True
+            elif old_values != values:
+                # Usually only status or duration changed; set just those cells
+                for column, old, new in zip(self.JOB_COLUMNS, old_values, values):
+                    if old != new:
+                        self.job_tree.set(job.id, column, new)
+                changed = True
+            self._job_rows[job.id] = values
+
+        if changed and self._job_sort:
+            self._apply_job_sort()
+
+    def _sort_jobs_by(self, column):
+        """Sort the job list by a column, toggling direction on repeated clicks"""
+        if self._job_sort and self._job_sort[0] == column:
+            self._job_sort = (column, not self._job_sort[1])
+        else:
+            self._job_sort = (column, False)
+        self._apply_job_sort()
+
+    def _apply_job_sort(self):
+        """Move rows into the active sort order, touching only misplaced rows"""
+        column, descending = self._job_sort
+        job_key = _JOB_SORT_KEYS.get(column)
+        if job_key is not None:
+            # Rows and the job snapshot are rebuilt together by the refresh
+            desired = sorted(self._job_rows, key=lambda job_id: job_key(self._job_cache[job_id]), reverse=descending)
+        else:
+            index = self.JOB_COLUMNS.index(column)
+            desired = sorted(self._job_rows, key=lambda job_id: self._job_rows[job_id][index], reverse=descending)
+
+        current = list(self.job_tree.get_children())
+        for position, job_id in enumerate(desired):
+            if current[position] != job_id:
+                self.job_tree.move(job_id, "", position)
+                current.remove(job_id)
+                current.insert(position, job_id)
+
+    def _on_jobs_changed(self):
+        """Queue manager callback; may run on the worker thread"""
+        if not self._refresh_pending:
+            self._post_ui(self._schedule_refresh)
+
+    def _schedule_refresh(self, force=False):
+        """Refresh the job list once the current burst of changes settles"""
+        if force:
+            self._refresh_forced = True
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after(self.REFRESH_DEBOUNCE_MS, self._do_refresh)
+
+    def _do_refresh(self, force=False):
+        """Run a scheduled job list refresh"""
+        force = force or self._refresh_forced
+        self._refresh_pending = False
+        self._refresh_forced = False
+        self._refresh_job_list(force)
+
+        # Keep durations ticking only while something is being processed
+        if (self._duration_tick_id is None and self.job_tree is not None
+                and any(job.status == "PROCESSING" for job in self._job_cache.values())):
+            self._duration_tick_id = self.root.after(self.RUNNING_REFRESH_MS, self._on_duration_tick)
+
+    def _on_duration_tick(self):
+        """Refresh running job durations"""
+        self._duration_tick_id = None
+        # Durations change without a job version bump
+        self._do_refresh(force=True)
+
+    def _get_jobs_window(self):
+        """Get the number of latest jobs to show"""
+        try:
+            return max(1, self._jobs_window_var.get())
+        except tk.TclError:
+            return self.JOBS_WINDOW_SIZE
+
+    def _on_jobs_scroll(self, event):
+        """Pull older jobs into the list when scrolling up past the top"""
+        scrolling_up = event.num == 4 or event.delta > 0
+        # While a refresh is pending the older rows are not in yet; don't grow again
+        if scrolling_up and not self._refresh_pending and self.job_tree.yview()[0] <= 0.0:
+            window = self._get_jobs_window()
+            if window < len(self.queue_manager.jobs):
+                self._jobs_window_var.set(window + self.JOBS_WINDOW_SIZE)
+                self._schedule_refresh(force=True)
 
     def _show_job_context_menu(self, event):
         """Show context menu for job tree items"""
@@ -667,23 +1171,17 @@ class EZCADAutomationApp:
             # Select the item
             self.job_tree.selection_set(iid)
 
-            # Get the job ID
-            job_id = self.job_tree.item(iid, "values")[0]
-
-            # Create popup menu
-            menu = tk.Menu(self.root, tearoff=0)
-            menu.add_command(label="View Details", command=lambda: self._show_job_details_by_id(job_id))
-            menu.add_command(label="Cancel Job", command=lambda: self._cancel_job(job_id))
+            # Rows are keyed by job ID
+            self._menu_job_id = iid
 
             # Display the menu
-            menu.post(event.x_root, event.y_root)
+            self._job_menu.post(event.x_root, event.y_root)
 
     def _show_job_details(self, event):
         """Show job details when an item is double-clicked"""
         iid = self.job_tree.focus()
         if iid:
-            job_id = self.job_tree.item(iid, "values")[0]
-            self._show_job_details_by_id(job_id)
+            self._show_job_details_by_id(iid)
 
     def _show_job_details_by_id(self, job_id):
         """Show job details by job ID"""
@@ -692,62 +1190,159 @@ class EZCADAutomationApp:
             messagebox.showerror("Error", f"Job not found: {job_id}")
             return
 
-        # Create a new dialog window
+        # One details window is built once and repopulated for each job
+        if self._details_window is None or not self._details_window.winfo_exists():
+            self._build_details_window()
+        self._details_window.title(f"Job Details: {job_id}")
+
+        # One label with preformatted lines instead of a widget per field
+        lines = [
+            f"ID: {job.id}",
+            f"Type: {job.job_type}",
+            f"Status: {job.status}",
+            f"Priority: {job.priority}",
+            f"Added: {job.added_time}",
+        ]
+
+        # Add timing information if available
+        if job.start_time:
+            lines.append(f"Started: {job.start_time}")
+        if job.end_time:
+            lines.append(f"Completed: {job.end_time}")
+        if job.duration is not None:
+            lines.append(f"Duration: {job.duration_str}")
+
+        self._details_info_var.set("\n".join(lines))
+        self._details_path_var.set(job.file_path)
+
+        # Results render when their tab is shown; redo them now if it already is
+        self._details_job = job
+        self._details_rendered_id = None
+        if self._details_notebook.select() == str(self._details_result_tab):
+            self._render_job_result(job)
+
+        self._details_window.deiconify()
+        self._details_window.lift()
+
+    def _build_details_window(self):
+        """Create the reusable job details window"""
         details_window = tk.Toplevel(self.root)
-        details_window.title(f"Job Details: {job_id}")
         details_window.geometry("600x400")
+        details_window.protocol("WM_DELETE_WINDOW", self._hide_details_window)
+        self._details_window = details_window
 
         # Add job information
         info_frame = ttk.LabelFrame(details_window, text="Job Information")
         info_frame.pack(fill=tk.X, padx=10, pady=10)
 
-        ttk.Label(info_frame, text=f"ID: {job.id}").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        ttk.Label(info_frame, text=f"Type: {job.job_type}").grid(row=0, column=1, sticky="w", padx=5, pady=5)
-        ttk.Label(info_frame, text=f"Status: {job.status}").grid(row=1, column=0, sticky="w", padx=5, pady=5)
-        ttk.Label(info_frame, text=f"Priority: {job.priority}").grid(row=1, column=1, sticky="w", padx=5, pady=5)
+        self._details_info_var = tk.StringVar()
+        ttk.Label(info_frame, textvariable=self._details_info_var, justify=tk.LEFT, font="TkFixedFont", style="Dialog.TLabel").pack(anchor="w", padx=5, pady=5)
 
-        ttk.Label(info_frame, text=f"Added: {job.added_time}").grid(row=2, column=0, sticky="w", padx=5, pady=5)
+        # File path and results share a notebook; results render on first view
+        self._details_notebook = ttk.Notebook(details_window)
+        self._details_notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        # Add timing information if available
-        if job.start_time:
-            ttk.Label(info_frame, text=f"Started: {job.start_time}").grid(row=3, column=0, sticky="w", padx=5, pady=5)
-        if job.end_time:
-            ttk.Label(info_frame, text=f"Completed: {job.end_time}").grid(row=3, column=1, sticky="w", padx=5, pady=5)
-            duration = job.end_time - job.start_time
-            ttk.Label(info_frame, text=f"Duration: {duration}").grid(row=4, column=0, sticky="w", padx=5, pady=5)
+        path_tab = ttk.Frame(self._details_notebook)
+        self._details_notebook.add(path_tab, text="File Path")
 
-        # Add file path
-        path_frame = ttk.LabelFrame(details_window, text="File Path")
-        path_frame.pack(fill=tk.X, padx=10, pady=10)
+        self._details_path_var = tk.StringVar()
+        ttk.Button(path_tab, text="Copy", command=self._copy_details_path, style="Dialog.TButton").pack(side=tk.RIGHT, padx=5, pady=5, anchor="n")
+        ttk.Label(path_tab, textvariable=self._details_path_var, anchor="w", style="Dialog.TLabel", cursor="xterm", wraplength=480).pack(side=tk.LEFT, padx=5, pady=5, fill=tk.X, expand=True, anchor="n")
 
-        path_entry = ttk.Entry(path_frame, width=80)
-        path_entry.pack(padx=5, pady=5, fill=tk.X)
-        path_entry.insert(0, job.file_path)
-        path_entry.config(state="readonly")
+        self._details_result_tab = ttk.Frame(self._details_notebook)
+        self._details_notebook.add(self._details_result_tab, text="Results")
 
-        # Add results/error information
-        result_frame = ttk.LabelFrame(details_window, text="Results")
-        result_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self._details_result_text = scrolledtext.ScrolledText(self._details_result_tab)
+        self._details_result_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self._details_result_text.tag_configure("error", foreground="red")
+        self._details_result_text.config(state=tk.DISABLED)
 
-        result_text = scrolledtext.ScrolledText(result_frame)
-        result_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self._details_notebook.bind("<<NotebookTabChanged>>", self._on_details_tab_changed)
+
+        # Close button
+        ttk.Button(details_window, text="Close", command=self._hide_details_window, style="Dialog.TButton").pack(pady=10)
+
+    def _hide_details_window(self):
+        """Hide the details window for reuse and stop any result streaming"""
+        self._details_chunks = None
+        self._details_window.withdraw()
+
+    def _copy_details_path(self):
+        """Copy the file path of the shown job to the clipboard"""
+        self.root.clipboard_clear()
+        self.root.clipboard_append(self._details_path_var.get())
+
+    def _on_details_tab_changed(self, event):
+        """Render the results of the shown job the first time its Results tab is selected"""
+        if self._details_notebook.select() == str(self._details_result_tab):
+            self._render_job_result(self._details_job)
+
+    def _render_job_result(self, job):
+        """Fill the results view for a job"""
+        if self._details_rendered_id == job.id:
+            return
+        self._details_rendered_id = job.id
+        self._details_chunks = None
+
+        result_text = self._details_result_text
+        result_text.config(state=tk.NORMAL)
+        result_text.delete("1.0", tk.END)
 
         if job.error:
-            result_text.insert(tk.END, f"ERROR:\n{job.error}")
-            result_text.tag_configure("error", foreground="red")
-            result_text.tag_add("error", "1.0", "end")
+            result_text.insert(tk.END, f"ERROR:\n{job.error}", "error")
         elif job.result:
-            if isinstance(job.result, dict):
-                result_text.insert(tk.END, json.dumps(job.result, indent=2))
-            else:
-                result_text.insert(tk.END, str(job.result))
+            result_type = type(job.result)
+            if result_type in _JSON_RESULT_TYPES:
+                # Encode and insert piece by piece so large results never stall the UI
+                result_text.config(state=tk.DISABLED)
+                self._details_chunks = self._encode_result(job.result)
+                self._stream_text(result_text, self._details_chunks)
+                return
+            result_text.insert(tk.END, _RESULT_FORMATTERS.get(result_type, str)(job.result))
         else:
             result_text.insert(tk.END, "No results available")
 
         result_text.config(state=tk.DISABLED)
 
-        # Close button
-        ttk.Button(details_window, text="Close", command=details_window.destroy).pack(pady=10)
+    def _encode_result(self, result):
+        """Get an iterator of indented JSON text chunks for a job result"""
+        if HAS_ORJSON:
+            try:
+                text = orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC).decode()
+                step = self.STREAM_CHUNK_CHARS
+                return (text[i:i + step] for i in range(0, len(text), step))
+            except TypeError:
+                # Types orjson cannot encode; let the json module report them
+                pass
+        return json.JSONEncoder(indent=2).iterencode(result)
+
+    def _stream_text(self, widget, chunks):
+        """Insert text chunks into a read-only widget in slices, yielding to Tk between them"""
+        # Stop once the widget is gone or another job's results replaced these
+        if not widget.winfo_exists() or chunks is not self._details_chunks:
+            return
+
+        parts = []
+        size = 0
+        done = False
+        try:
+            for chunk in chunks:
+                parts.append(chunk)
+                size += len(chunk)
+                if size >= self.STREAM_CHUNK_CHARS:
+                    break
+            else:
+                done = True
+        except (TypeError, ValueError) as e:
+            parts.append(f"\n<result could not be displayed: {str(e)}>")
+            done = True
+
+        widget.config(state=tk.NORMAL)
+        widget.insert(tk.END, "".join(parts))
+        widget.config(state=tk.DISABLED)
+
+        if not done:
+            widget.after_idle(self._stream_text, widget, chunks)
 
     def _cancel_job(self, job_id):
         """Cancel a job by ID"""
@@ -755,17 +1350,47 @@ class EZCADAutomationApp:
         if job and job.status == "PENDING":
             if self.queue_manager.cancel_job(job_id):
                 self.logger.info(f"Canceled job: {job_id}")
-                self._refresh_job_list()
+
+                # Only this row's status changed
+                values = self._job_rows.get(job_id)
+                if values is not None:
+                    status_index = self.JOB_COLUMNS.index("status")
+                    self._job_rows[job_id] = values[:status_index] + (job.status,) + values[status_index + 1:]
+                    self.job_tree.set(job_id, "status", job.status)
             else:
                 messagebox.showerror("Error", f"Failed to cancel job: {job_id}")
         else:
-            messagebox.showinfo("Info", "Job cannot be canceled (not in pending state)")
+            self._flash_status(f"Job {job_id} is not pending and cannot be canceled")
+
+    def _set_status(self, text):
+        """Show text in the status bar, skipping the Tk write when it is already shown"""
+        if text != self._status_text:
+            self._status_text = text
+            self.status_var.set(text)
+
+    def _flash_status(self, text, duration_ms=3000):
+        """Show a transient message in the status bar, then go back to Ready"""
+        self._set_status(text)
+
+        def restore():
+            # Leave the status alone if something else has replaced the message
+            if self._status_text == text:
+                self._set_status("Ready")
+
+        self.root.after(duration_ms, restore)
 
     def _clear_completed_jobs(self):
         """Clear completed jobs from the queue"""
-        count = self.queue_manager.clear_completed_jobs()
-        self.logger.info(f"Cleared {count} completed jobs")
-        self._refresh_job_list()
+        cleared = self.queue_manager.clear_completed_jobs()
+        self.logger.info(f"Cleared {len(cleared)} completed jobs")
+
+        # Drop exactly the cleared rows in one call and repaint without a full refresh
+        removed = [job_id for job_id in cleared if job_id in self._job_rows]
+        if removed:
+            self.job_tree.delete(*removed)
+            for job_id in removed:
+                del self._job_rows[job_id]
+            self.root.update_idletasks()
 
     def _save_profile(self):
         """Save current settings as a profile"""
@@ -800,20 +1425,20 @@ class EZCADAutomationApp:
         profile_window.geometry("300x400")
 
         # Profile list
-        ttk.Label(profile_window, text="Select a profile to load:").pack(padx=10, pady=10)
+        ttk.Label(profile_window, text="Select a profile to load:", style="Dialog.TLabel").pack(padx=10, pady=10)
 
         profile_listbox = tk.Listbox(profile_window)
         profile_listbox.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-        for profile in profiles:
-            profile_listbox.insert(tk.END, profile)
+        # One Tk call for the whole list
+        profile_listbox.insert(tk.END, *profiles)
 
         # Buttons
         button_frame = ttk.Frame(profile_window)
         button_frame.pack(fill=tk.X, padx=10, pady=10)
 
-        ttk.Button(button_frame, text="Load", command=lambda: self._load_selected_profile(profile_listbox, profile_window)).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=profile_window.destroy).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Load", command=lambda: self._load_selected_profile(profile_listbox, profile_window), style="Dialog.TButton").pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=profile_window.destroy, style="Dialog.TButton").pack(side=tk.RIGHT, padx=5)
 
     def _load_selected_profile(self, listbox, window):
         """Load the selected profile"""
@@ -825,7 +1450,8 @@ class EZCADAutomationApp:
         profile_name = listbox.get(selection[0])
 
         try:
-            self.config.load_profile(profile_name)
+            self.config.load_profile(profile_name, save=False)
+            self._do_save()
             self.logger.info(f"Loaded profile: {profile_name}")
 
             # Refresh UI with loaded settings
@@ -842,13 +1468,22 @@ class EZCADAutomationApp:
         """Open the log directory in file explorer"""
         log_dir = os.path.join(os.getcwd(), "logs")
         if os.path.exists(log_dir):
+            # Launching the file manager can block briefly; keep it off the Tk thread
+            self._executor.submit(self._open_in_file_manager, log_dir)
+        else:
+            messagebox.showerror("Error", "Log directory not found")
+
+    def _open_in_file_manager(self, path):
+        """Open a directory in the platform file manager (runs on the worker pool)"""
+        try:
             if os.name == 'nt':  # Windows
-                os.startfile(log_dir)
+                os.startfile(path)
             elif os.name == 'posix':  # macOS, Linux
                 import subprocess
-                subprocess.Popen(['xdg-open', log_dir])
-        else:
-            messagebox.showerror("Error", "Log directory not found")
+                subprocess.Popen(['xdg-open', path], stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL, start_new_session=True)
+        except Exception as e:
+            self.logger.error(f"Failed to open {path}: {str(e)}")
 
     def _start_automation(self):
         """Start all automated components"""
@@ -858,24 +1493,71 @@ class EZCADAutomationApp:
         # Start directory monitoring if enabled
         if self.config.getboolean('Monitoring', 'enabled', False):
             self.directory_watcher.start_watching()
-            self.start_monitoring_button.config(state=tk.DISABLED)
-            self.stop_monitoring_button.config(state=tk.NORMAL)
+            self._set_monitoring_buttons(True)
 
         self.logger.info("Automation started")
-        self.status_var.set("Automation active")
+        self._set_status("Automation active")
 
     def on_closing(self):
         """Handle window closing"""
         if messagebox.askyesno("Exit", "Are you sure you want to exit?"):
-            # Stop monitoring and processing
-            self.directory_watcher.stop_watching()
-            self.queue_manager.stop_processing()
+            self._closing = True
 
-            # Close any open EZCAD instances
-            self.ezcad_controller.close_all_ezcad()
+            # Flush a pending debounced config save and wait for it to reach disk
+            self._do_save()
+            self._config_writer.shutdown(wait=True)
 
             # Stop the log panel
             self.log_panel.stop()
 
-            # Destroy the window
-            self.root.destroy()
\ No newline at end of file
+            # Drop queued background work. Pool threads are not daemons, so a
+            # start_ezcad or send_command call already running still holds the
+            # process open after the window is gone, bounded only by that call's
+            # own window and command timeouts
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+            # Hide the main window and show progress while teardown runs
+            self.root.withdraw()
+            shutdown_window = tk.Toplevel(self.root)
+            shutdown_window.title("EZCAD2 Automation")
+            shutdown_window.resizable(False, False)
+            ttk.Label(shutdown_window, text="Shutting down...").pack(padx=20, pady=(15, 5))
+            progress = ttk.Progressbar(shutdown_window, mode="indeterminate", length=200)
+            progress.pack(padx=20, pady=(5, 15))
+            progress.start(10)
+
+            # Stop monitoring and processing and close EZCAD instances in parallel
+            # on daemon threads, so a step stuck past SHUTDOWN_TIMEOUT can't block exit
+            futures = [
+                self._run_daemon(self.directory_watcher.stop_watching),
+                self._run_daemon(self.queue_manager.stop_processing),
+                self._run_daemon(self.ezcad_controller.close_all_ezcad),
+            ]
+            self._check_shutdown_done(futures, time.monotonic() + self.SHUTDOWN_TIMEOUT)
+
+    @staticmethod
+    def _run_daemon(func):
+        """Run func on a daemon thread and return a Future for its result"""
+        future = Future()
+
+        def run():
+            try:
+                future.set_result(func())
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
+    def _check_shutdown_done(self, futures, deadline):
+        """Destroy the window once teardown finishes or takes too long"""
+        if not all(future.done() for future in futures) and time.monotonic() < deadline:
+            self.root.after(50, self._check_shutdown_done, futures, deadline)
+            return
+
+        for future in futures:
+            if future.done() and future.exception():
+                self.logger.error(f"Error during shutdown: {str(future.exception())}")
+
+        # Destroy the window
+        self.root.destroy()
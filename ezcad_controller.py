@@ -1,4 +1,5 @@
 import os
+import re
 import time
 import psutil
 import logging
@@ -7,8 +8,152 @@ import threading
 from platform_utils import PlatformUtils, IS_WINDOWS
 
 if IS_WINDOWS:
+    import ctypes
+    from ctypes import wintypes
     from pywinauto.application import Application
 
+    TH32CS_SNAPPROCESS = 0x00000002
+    PROCESS_QUERY_INFORMATION = 0x0400
+    SYNCHRONIZE = 0x00100000
+    INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", wintypes.LONG),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", wintypes.WCHAR * 260),
+        ]
+
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    _kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    _kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    _kernel32.Process32FirstW.restype = wintypes.BOOL
+    _kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    _kernel32.Process32NextW.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+    _kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+
+    WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+
+    _user32 = ctypes.WinDLL('user32', use_last_error=True)
+    _user32.EnumWindows.argtypes = [WNDENUMPROC, wintypes.LPARAM]
+    _user32.EnumWindows.restype = wintypes.BOOL
+    _user32.IsWindowVisible.argtypes = [wintypes.HWND]
+    _user32.IsWindowVisible.restype = wintypes.BOOL
+    _user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+    _user32.GetWindowTextLengthW.restype = ctypes.c_int
+    _user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+    _user32.GetWindowTextW.restype = ctypes.c_int
+    _user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+    _user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+    _user32.WaitForInputIdle.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    _user32.WaitForInputIdle.restype = wintypes.DWORD
+
+EZCAD_EXE_NAME = "ezcad2.exe"
+# Backoff between window lookups while waiting for EZCAD (seconds)
+POLL_INITIAL_DELAY = 0.05
+POLL_MAX_DELAY = 1.0
+# Longest wait for a new EZCAD2 process to finish initializing its UI (seconds)
+INPUT_IDLE_TIMEOUT = 10.0
+# Recheck for the license dialog after dismissing it (seconds)
+AGREE_RECHECK_TIMEOUT = 1.0
+# How long a "is EZCAD2 running" answer is reused (seconds)
+RUNNING_CHECK_TTL = 2.0
+
+# Window title patterns, compiled once at import
+AGREE_TITLE_RE = re.compile(r".*I Agree.*")
+EZCAD_TITLE_RE = re.compile(r".*EZCAD2.*")
+
+
+def _is_ezcad_running():
+    """Return True as soon as a process named EZCAD2.exe is found (case-insensitive)"""
+    if not IS_WINDOWS:
+        return any((proc.info['name'] or '').lower() == EZCAD_EXE_NAME
+                   for proc in psutil.process_iter(['name']))
+
+    snapshot = _kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        found = _kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+            if entry.szExeFile.lower() == EZCAD_EXE_NAME:
+                return True
+            found = _kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        return False
+    finally:
+        _kernel32.CloseHandle(snapshot)
+
+
+def _wait_for_input_idle(pid, timeout):
+    """Block until a freshly started process is waiting for user input
+
+    Returns True once the process is idle, False on timeout, for processes
+    without a GUI, or when the process cannot be opened.
+    """
+    handle = _kernel32.OpenProcess(PROCESS_QUERY_INFORMATION | SYNCHRONIZE, False, pid)
+    if not handle:
+        return False
+    try:
+        return _user32.WaitForInputIdle(handle, int(timeout * 1000)) == 0
+    finally:
+        _kernel32.CloseHandle(handle)
+
+
+def _find_hwnd_by_title(title_pattern, timeout, pid=None):
+    """Poll top-level windows until a visible one's title matches title_pattern
+
+    title_pattern may be a string or a compiled pattern; matching follows
+    pywinauto's title_re semantics (re.match). If pid is given, only windows
+    owned by that process are considered. Returns the window handle, or None
+    once timeout seconds have passed.
+    """
+    title_re = re.compile(title_pattern)  # No-op for precompiled patterns
+    deadline = time.monotonic() + timeout
+    delay = POLL_INITIAL_DELAY
+
+    while True:
+        matches = []
+
+        def callback(hwnd, lparam):
+            if pid is not None:
+                owner_pid = wintypes.DWORD()
+                _user32.GetWindowThreadProcessId(hwnd, ctypes.byref(owner_pid))
+                if owner_pid.value != pid:
+                    return True
+            if _user32.IsWindowVisible(hwnd):
+                length = _user32.GetWindowTextLengthW(hwnd)
+                if length:
+                    buffer = ctypes.create_unicode_buffer(length + 1)
+                    _user32.GetWindowTextW(hwnd, buffer, length + 1)
+                    if title_re.match(buffer.value):
+                        matches.append(hwnd)
+                        return False  # Stop enumerating
+            return True
+
+        _user32.EnumWindows(WNDENUMPROC(callback), 0)
+        if matches:
+            return matches[0]
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, POLL_MAX_DELAY)
+
+
 class EZCADController:
     """Control EZCAD2 application instances"""
 
@@ -16,12 +161,27 @@ class EZCADController:
         """Initialize the EZCAD controller"""
         self.config_manager = config_manager
         self.logger = logger or logging.getLogger('EZCADAutomation')
-        self.instances = {}  # Store active EZCAD instances: window_id -> info
-        self.lock = threading.Lock()  # For thread safety
+        # Active EZCAD instances: window_id -> info. Never mutated in place; writers
+        # swap in a new dict under the lock, so readers can use it without locking
+        self.instances = {}
+        self.lock = threading.Lock()  # Serializes writers only
+        # Focus and keystrokes are global, so commands go out one at a time
+        self._input_lock = threading.Lock()
+        # (monotonic time, result) of the last process table scan
+        self._running_check = (float('-inf'), False)
 
         if not IS_WINDOWS:
             self.logger.warning("Running in non-Windows environment. EZCAD features will be simulated.")
 
+    def _is_ezcad_running_cached(self):
+        """Check for a running EZCAD2, reusing a scan from the last RUNNING_CHECK_TTL seconds"""
+        checked_at, running = self._running_check
+        now = time.monotonic()
+        if now - checked_at >= RUNNING_CHECK_TTL:
+            running = _is_ezcad_running()
+            self._running_check = (now, running)
+        return running
+
     def start_ezcad(self, ezd_file=None):
         """Start a new EZCAD2 instance"""
         try:
@@ -31,10 +191,9 @@ class EZCADController:
                 return None
 
             if not self.config_manager.getboolean('Settings', 'multiple_instances', fallback=False):
-                for proc in psutil.process_iter(['pid', 'name']):
-                    if 'EZCAD2.exe' in proc.info['name']:
-                        self.logger.warning("EZCAD2 already running - new instance not started")
-                        return None
+                if self._is_ezcad_running_cached():
+                    self.logger.warning("EZCAD2 already running - new instance not started")
+                    return None
 
             cmd = [exe_path]
             if ezd_file:
@@ -43,89 +202,103 @@ class EZCADController:
                     return None
                 cmd.append(ezd_file)
 
+            # Detach EZCAD2 from our console and handles so its output can't stall us
+            creationflags = 0
+            if IS_WINDOWS:
+                creationflags = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
             try:
-                process = os.spawnv(os.P_NOWAIT, exe_path, cmd)
-                if process:
-                    self.logger.info("EZCAD2 process started successfully")
+                process = subprocess.Popen(cmd, close_fds=True, creationflags=creationflags,
+                                           stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                           stderr=subprocess.DEVNULL)
+                self.logger.info(f"EZCAD2 process started successfully (PID {process.pid})")
+                # Back-to-back starts must see this instance without a rescan
+                self._running_check = (time.monotonic(), True)
             except Exception as e:
                 self.logger.error(f"Failed to start EZCAD2 process: {str(e)}")
                 return None
 
+            # Let EZCAD2 build its first window before searching, instead of polling blind
+            if IS_WINDOWS and not _wait_for_input_idle(process.pid, INPUT_IDLE_TIMEOUT):
+                self.logger.debug("EZCAD2 did not report input idle; searching for its windows anyway")
+
             window_id = None
             # First try to find and handle the I Agree dialog
-            for _ in range(5):  # Try for 5 seconds
-                time.sleep(1)
+            agree = self._connect_by_title(AGREE_TITLE_RE, timeout=5)
+            if agree:
+                agree_window = agree[1]
+                # Try multiple ways to close the dialog
                 try:
-                    agree_app = Application().connect(title_re=".*I Agree.*", timeout=1)
-                    agree_window = agree_app.top_window()
-                    if agree_window.is_visible():
-                        # Try multiple ways to close the dialog
+                    agree_window.set_focus()
+                    time.sleep(0.2)
+                    agree_window.type_keys("{ENTER}")
+                    time.sleep(0.5)
+                except Exception:
+                    try:
+                        agree_window.set_focus()
+                        time.sleep(0.2)
+                        agree_window.type_keys(" ")
+                        time.sleep(0.5)
+                    except Exception:
                         try:
-                            agree_window.set_focus()
-                            time.sleep(0.2)
-                            agree_window.type_keys("{ENTER}")
+                            agree_button = agree_window.child_window(title="I Agree", class_name="Button")
+                            agree_button.click()
                             time.sleep(0.5)
                         except Exception:
-                            try:
-                                agree_window.set_focus()
-                                time.sleep(0.2)
-                                agree_window.type_keys(" ")
-                                time.sleep(0.5)
-                            except Exception:
-                                try:
-                                    agree_button = agree_window.child_window(title="I Agree")
-                                    agree_button.click()
-                                    time.sleep(0.5)
-                                except Exception:
-                                    pass
-                        break
-                except Exception:
-                    continue
+                            pass
 
             # EZCAD başlatıldıktan hemen sonra:
-            for _ in range(10):  # 10 saniye boyunca dene
-                time.sleep(1)
+            # After a dismissal only make sure it is gone; otherwise keep waiting for it
+            agree = self._connect_by_title(AGREE_TITLE_RE, timeout=AGREE_RECHECK_TIMEOUT if agree else 10)
+            if agree:
                 try:
-                    agree_app = Application().connect(title_re=".*I Agree.*", timeout=1)
-                    agree_window = agree_app.top_window()
-                    if agree_window.is_visible():
-                        agree_window.set_focus()
-                        time.sleep(0.2)
-                        agree_window.type_keys("{ENTER}")
-                        time.sleep(0.5)
-                        break
+                    agree_window = agree[1]
+                    agree_window.set_focus()
+                    time.sleep(0.2)
+                    agree_window.type_keys("{ENTER}")
+                    time.sleep(0.5)
                 except Exception:
-                    continue
+                    pass
 
             # Then look for the main EZCAD window
-            for _ in range(10):
-                time.sleep(1)
-                try:
+            if ezd_file:
+                title_pattern = re.compile(f".*{re.escape(os.path.basename(ezd_file))}.*")
+            else:
+                title_pattern = EZCAD_TITLE_RE
+
+            # Only look at windows of the process we launched. If it has already
+            # exited (a launcher that hands off to another process), search all.
+            pid = process.pid if process.poll() is None else None
+
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                found = self._connect_by_title(title_pattern, timeout=deadline - time.monotonic(), pid=pid)
+                if not found:
+                    continue
 
-                    if ezd_file:
-                        ezd_name = os.path.basename(ezd_file).replace(".", "\.")
-                        app = Application().connect(title_re=f".*{ezd_name}.*")
-                    else:
-                        app = Application().connect(title_re=f".*EZCAD2.*")
+                try:
+                    app, window = found
 
-                    window = app.top_window()
-                    window.set_focus()
+                    # Resolve the window once; later commands reuse the wrapper
+                    wrapper = window.wrapper_object()
+                    wrapper.set_focus()
                     time.sleep(0.5)
                     window_id = f"ezcad_{int(time.time() * 1000)}"
 
-                    with self.lock:
-                        self.instances[window_id] = {
-                            'app': app,
-                            'window': window,
-                            'ezd_file': ezd_file,
-                            'start_time': time.time()
-                        }
+                    self.register_instance(window_id, {
+                        'app': app,
+                        'window': window,
+                        'wrapper': wrapper,
+                        'pid': process.pid,
+                        'ezd_file': ezd_file,
+                        'start_time': time.time()
+                    })
 
                     self.logger.info(f"EZCAD2 started with window ID: {window_id}")
                     break
 
                 except Exception as e:
                     self.logger.debug(f"Waiting for EZCAD window: {str(e)}")
+                    time.sleep(POLL_INITIAL_DELAY)
 
             if not window_id:
                 self.logger.error("Failed to connect to EZCAD window after launch")
@@ -136,77 +309,98 @@ class EZCADController:
             self.logger.error(f"Error starting EZCAD: {str(e)}")
             return None
 
+    def _connect_by_title(self, title_pattern, timeout, pid=None):
+        """Wait for a window matching title_pattern and connect to it by handle
+
+        Returns an (app, window) tuple, or None if no window appeared in time.
+        """
+        hwnd = _find_hwnd_by_title(title_pattern, timeout, pid)
+        if not hwnd:
+            return None
+        try:
+            app = Application(backend="win32").connect(handle=hwnd)
+            return app, app.window(handle=hwnd)
+        except Exception as e:
+            self.logger.debug(f"Could not connect to window {hwnd}: {str(e)}")
+            time.sleep(POLL_INITIAL_DELAY)
+            return None
+
     def send_command(self, window_id, command):
         """Send a command to EZCAD instance"""
+        with self._input_lock:
+            return self._send_command(window_id, command)
+
+    def _send_command(self, window_id, command):
+        """Send a command to EZCAD instance while holding the input lock"""
         try:
-            with self.lock:
-                instance = self.instances.get(window_id)
-                if not instance:
-                    self.logger.warning(f"EZCAD instance not found: {window_id}")
-                    return False
+            instance = self.instances.get(window_id)
+            if not instance:
+                self.logger.warning(f"EZCAD instance not found: {window_id}")
+                return False
 
-                window = instance['window']
-                app = instance['app']
+            window = instance['window']
+            wrapper = instance['wrapper']
+            app = instance['app']
 
-                # Verify window is still valid
-                try:
-                    window.wait('visible', timeout=5)
-                except Exception as e:
-                    self.logger.error(f"Window validation failed: {str(e)}")
-                    return False
+            # Verify window is still valid
+            try:
+                window.wait('visible', timeout=5)
+            except Exception as e:
+                self.logger.error(f"Window validation failed: {str(e)}")
+                return False
 
-                # Check if EZCAD2 is still running
-                if not app.is_process_running():
-                    self.logger.error("EZCAD2 process is not running")
-                    return False
+            # Check if EZCAD2 is still running
+            if not app.is_process_running():
+                self.logger.error("EZCAD2 process is not running")
+                return False
 
-                # Ensure window is visible and active
-                try:
-                    if not window.is_visible():
-                        window.restore()
-                        time.sleep(1.0)
-
-                    # Try multiple times to set focus
-                    max_attempts = 3
-                    for attempt in range(max_attempts):
-                        window.set_focus()
-                        time.sleep(0.5)
+            # Ensure window is visible and active
+            try:
+                if not wrapper.is_visible():
+                    wrapper.restore()
+                    time.sleep(1.0)
+
+                # Try multiple times to set focus
+                max_attempts = 3
+                for attempt in range(max_attempts):
+                    wrapper.set_focus()
+                    time.sleep(0.5)
+
+                    if wrapper.is_active():
+                        break
 
-                        if window.is_active():
-                            break
+                    if attempt == max_attempts - 1:
+                        self.logger.error("Failed to activate EZCAD window after multiple attempts")
+                        return False
 
-                        if attempt == max_attempts - 1:
-                            self.logger.error("Failed to activate EZCAD window after multiple attempts")
-                            return False
+                    time.sleep(1.0)
 
-                        time.sleep(1.0)
+                command = command.lower()
+                if command == 'red':
+                    wrapper.set_focus()
+                    time.sleep(0.5)
+                    wrapper.type_keys("{F1}", set_foreground=False)
+                    self.logger.info(f"Sent RED command to window {window_id}")
+                    time.sleep(1.0)  # Wait for command to take effect
+                    return True
 
-                    command = command.lower()
-                    if command == 'red':
-                        window.set_focus()
-                        time.sleep(0.5)
-                        window.type_keys("{F1}")
-                        self.logger.info(f"Sent RED command to window {window_id}")
-                        time.sleep(1.0)  # Wait for command to take effect
-                        return True
-
-                    elif command == 'mark':
-                        window.set_focus()
-                        time.sleep(1)
-                        window.type_keys("{F2}")
-                        time.sleep(2) 
-                        self.logger.info(f"Sent MARK command to window {window_id}")
-                        time.sleep(1.0)  # Wait for command to take effect
-                        return True
-
-                    else:
-                        self.logger.warning(f"Unknown command: {command}")
-                        return False
+                elif command == 'mark':
+                    wrapper.set_focus()
+                    time.sleep(1)
+                    wrapper.type_keys("{F2}", set_foreground=False)
+                    time.sleep(2) 
+                    self.logger.info(f"Sent MARK command to window {window_id}")
+                    time.sleep(1.0)  # Wait for command to take effect
+                    return True
 
-                except Exception as e:
-                    self.logger.error(f"Error sending command {command} to window {window_id}: {str(e)}")
+                else:
+                    self.logger.warning(f"Unknown command: {command}")
                     return False
 
+            except Exception as e:
+                self.logger.error(f"Error sending command {command} to window {window_id}: {str(e)}")
+                return False
+
         except Exception as e:
             self.logger.error(f"Error sending command {command} to window {window_id}: {str(e)}")
             return False
@@ -214,30 +408,29 @@ class EZCADController:
     def close_ezcad(self, window_id):
         """Close a specific EZCAD instance"""
         try:
-            with self.lock:
-                instance = self.instances.get(window_id)
-                if not instance:
-                    self.logger.warning(f"EZCAD instance not found: {window_id}")
-                    return False
+            instance = self.instances.get(window_id)
+            if not instance:
+                self.logger.warning(f"EZCAD instance not found: {window_id}")
+                return False
 
-                try:
-                    window = instance['window']
-                    window.close()
-                    time.sleep(0.5)
+            # Closing waits on the window; other instances stay usable meanwhile
+            try:
+                instance['wrapper'].close()
+                time.sleep(0.5)
 
-                    try:
-                        save_dialog = instance['app'].top_window()
-                        save_dialog.type_keys("{ESC}")
-                    except:
-                        pass
+                try:
+                    save_dialog = instance['app'].top_window()
+                    save_dialog.type_keys("{ESC}")
+                except:
+                    pass
 
-                    del self.instances[window_id]
-                    self.logger.info(f"Closed EZCAD instance: {window_id}")
-                    return True
+                self.unregister_instance(window_id)
+                self.logger.info(f"Closed EZCAD instance: {window_id}")
+                return True
 
-                except Exception as e:
-                    self.logger.error(f"Error closing EZCAD instance {window_id}: {str(e)}")
-                    return False
+            except Exception as e:
+                self.logger.error(f"Error closing EZCAD instance {window_id}: {str(e)}")
+                return False
 
         except Exception as e:
             self.logger.error(f"Error in close_ezcad: {str(e)}")
@@ -245,8 +438,7 @@ class EZCADController:
 
     def close_all_ezcad(self):
         """Close all tracked EZCAD instances"""
-        with self.lock:
-            window_ids = list(self.instances.keys())
+        window_ids = list(self.instances)
 
         closed_count = 0
         for window_id in window_ids:
@@ -256,7 +448,19 @@ class EZCADController:
         self.logger.info(f"Closed {closed_count} EZCAD instances")
         return closed_count
 
+    def register_instance(self, window_id, info):
+        """Track an EZCAD instance by publishing a new instances dict"""
+        with self.lock:
+            self.instances = {**self.instances, window_id: info}
+
+    def unregister_instance(self, window_id):
+        """Stop tracking an EZCAD instance by publishing a new instances dict"""
+        with self.lock:
+            if window_id in self.instances:
+                instances = dict(self.instances)
+                del instances[window_id]
+                self.instances = instances
+
     def get_active_instances(self):
         """Get all active EZCAD instances"""
-        with self.lock:
-            return self.instances.copy()
\ No newline at end of file
+        return dict(self.instances)
\ No newline at end of file
@@ -3,7 +3,6 @@ import os
 from logging.handlers import RotatingFileHandler
 import tkinter as tk
 from tkinter import scrolledtext
-import threading
 import queue
 import datetime
 
@@ -13,7 +12,8 @@ class LoggerSetup:
     def __init__(self):
         """Initialize the logger"""
         self.log_dir = "logs"
-        self.log_queue = queue.Queue()
+        # Many producer threads, one Tk-side consumer: no blocking or task tracking needed
+        self.log_queue = queue.SimpleQueue()
         self._setup_log_directory()
         self._configure_logger()
         
@@ -72,6 +72,11 @@ class QueueHandler(logging.Handler):
 class LogPanel:
     """A log panel that can be embedded in a Tkinter GUI"""
     
+    # How often queued log records are written to the widget
+    POLL_INTERVAL_MS = 100
+    # Most records written per tick, so a logging burst cannot stall the event loop
+    MAX_RECORDS_PER_TICK = 500
+    
     def __init__(self, parent_frame, log_queue):
         """Initialize the log panel within a parent frame"""
         self.log_queue = log_queue
@@ -89,33 +94,46 @@ class LogPanel:
         self.log_widget.tag_config('ERROR', foreground="red")
         self.log_widget.tag_config('CRITICAL', foreground="red", background="yellow")
         
-        # Start the queue consumer thread
+        # Drain the queue from the Tk event loop; Tk must not be touched from other threads
         self.running = True
-        self.queue_thread = threading.Thread(target=self._process_log_queue)
-        self.queue_thread.daemon = True
-        self.queue_thread.start()
+        self.log_widget.after(self.POLL_INTERVAL_MS, self._process_log_queue)
     
     def _process_log_queue(self):
-        """Process log records from the queue and display them in the widget"""
-        while self.running:
+        """Move queued log records into the widget with a single insert"""
+        if not self.running:
+            return
+        
+        # Alternating text and tag arguments for one Text.insert call
+        insert_args = []
+        backlog = False
+        for _ in range(self.MAX_RECORDS_PER_TICK):
             try:
-                # Get a log record from the queue with a timeout
-                record = self.log_queue.get(block=True, timeout=0.2)
-                self._display_log(record)
+                record = self.log_queue.get_nowait()
             except queue.Empty:
-                # If queue is empty, just continue the loop
-                continue
+                break
+            try:
+                insert_args.extend((self.format_log_record(record) + '\n', record.levelname))
             except Exception as e:
-                # If any other error occurs, print it and continue
+                # Skip records that cannot be formatted
                 print(f"Error processing log queue: {e}")
-    
-    def _display_log(self, record):
-        """Display a log record in the widget"""
-        msg = self.format_log_record(record)
+        else:
+            # Hit the cap; more records are probably waiting
+            backlog = True
+        
+        if insert_args:
+            self._display_logs(insert_args)
         
+        # Come straight back for a backlog, after letting pending UI events run
+        if backlog:
+            self.log_widget.after(1, self._process_log_queue)
+        else:
+            self.log_widget.after(self.POLL_INTERVAL_MS, self._process_log_queue)
+    
+    def _display_logs(self, insert_args):
+        """Display formatted log lines, each followed by its level tag, in the widget"""
         # Enable widget to insert text, then disable it again to make it read-only
         self.log_widget.config(state=tk.NORMAL)
-        self.log_widget.insert(tk.END, msg + '\n', record.levelname)
+        self.log_widget.insert(tk.END, *insert_args)
         self.log_widget.see(tk.END)  # Scroll to end
         self.log_widget.config(state=tk.DISABLED)
     
@@ -130,5 +148,5 @@ class LogPanel:
         self.log_widget.config(state=tk.DISABLED)
     
     def stop(self):
-        """Stop the log processing thread"""
+        """Stop draining the log queue"""
         self.running = False
@@ -4,6 +4,7 @@ import sys
 IS_WINDOWS = platform.system().lower() == 'windows'
 IS_LINUX = platform.system().lower() == 'linux'
 IS_MAC = platform.system().lower() == 'darwin'
+PLATFORM_STR = f"{platform.system()} {platform.release()}"
 
 class PlatformUtils:
     @staticmethod
@@ -18,6 +19,10 @@ class PlatformUtils:
     def is_mac():
         return IS_MAC
 
+    @staticmethod
+    def get_platform_info():
+        return PLATFORM_STR
+
     @staticmethod
     def get_system_info():
         return {
@@ -1,12 +1,21 @@
+import os
 import queue
 import threading
+import itertools
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 
+# Suffix that keeps job IDs unique when several jobs are added in the same millisecond
+_job_counter = itertools.count(1)
+
+def _format_duration(seconds):
+    """Format a number of seconds as H:MM:SS"""
+    return str(timedelta(seconds=int(seconds)))
+
 class Job:
     def __init__(self, file_path, job_type, priority=0):
-        self.id = f"job_{int(time.time() * 1000)}"
+        self.id = f"job_{int(time.time() * 1000)}_{next(_job_counter)}"
         self.file_path = file_path
         self.job_type = job_type
         self.priority = priority
@@ -17,24 +26,93 @@ class Job:
         self.result = None
         self.error = None
 
+        # Display strings that never change once the job exists
+        self.file_basename = os.path.basename(file_path)
+        self.added_time_str = self.added_time.strftime("%Y-%m-%d %H:%M:%S")
+        self.start_monotonic = None
+        self.duration = None  # timedelta, set once the job finishes
+        self.duration_str = ""
+
+    def mark_started(self):
+        """Record the start of processing"""
+        self.start_time = datetime.now()
+        self.start_monotonic = time.monotonic()
+
+    def mark_finished(self):
+        """Record the end of processing and freeze the duration string"""
+        self.end_time = datetime.now()
+        if self.start_monotonic is not None:
+            self.duration = timedelta(seconds=time.monotonic() - self.start_monotonic)
+            self.duration_str = _format_duration(self.duration.total_seconds())
+
+    def get_duration_str(self):
+        """Get the duration for display, computed live only while running"""
+        if self.end_time is None and self.start_monotonic is not None:
+            return _format_duration(time.monotonic() - self.start_monotonic)
+        return self.duration_str
+
+    def get_duration_seconds(self):
+        """Get the duration in seconds, live while running and None if never started"""
+        if self.duration is not None:
+            return self.duration.total_seconds()
+        if self.start_monotonic is not None:
+            return time.monotonic() - self.start_monotonic
+        return None
+
 class QueueManager:
     def __init__(self, processor, config, logger=None):
         self.processor = processor
         self.config = config
         self.logger = logger or logging.getLogger('EZCADAutomation')
+        # Entries are (priority, sequence, job); the sequence keeps equal
+        # priorities in FIFO order without ever comparing Job objects
         self.file_queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._dedup_lock = threading.Lock()
+        self._queued_paths = set()  # Watched files already waiting for processing
         self.jobs = {}
+        self.version = 0  # Bumped on every job change; lets views skip idle refreshes
+        self._change_callbacks = []
         self.should_run = False
         self.processing_thread = None
 
+    def on_change(self, callback):
+        """Register a callback run whenever jobs are added, change state or are removed
+
+        Callbacks may run on the worker thread and must not touch Tk directly.
+        """
+        self._change_callbacks.append(callback)
+
+    def _notify_change(self):
+        """Bump the job version and run the registered change callbacks"""
+        with self._dedup_lock:
+            self.version += 1
+        for callback in self._change_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error(f"Error in job change callback: {str(e)}")
+
     def add_job(self, file_path, job_type, priority=0):
         """Add a new job to the queue"""
         job = Job(file_path, job_type, priority)
         self.jobs[job.id] = job
-        self.file_queue.put((priority, job))
+        self.file_queue.put((priority, next(self._seq), job))
         self.logger.info(f"Added job {job.id} to queue: {file_path}")
+        self._notify_change()
         return job.id
 
+    def add_file_job(self, file_path, priority=0):
+        """Add a job for a watched file unless that file is already waiting"""
+        with self._dedup_lock:
+            if file_path in self._queued_paths:
+                self.logger.debug(f"File already queued, skipping: {file_path}")
+                return None
+            self._queued_paths.add(file_path)
+
+        job_type = "ezd" if file_path.lower().endswith('.ezd') else "excel"
+        return self.add_job(file_path, job_type, priority)
+
     def start_processing(self):
         """Start processing jobs from the queue"""
         if not self.should_run:
@@ -55,12 +133,16 @@ class QueueManager:
         """Process jobs from the queue"""
         while self.should_run:
             try:
-                priority, job = self.file_queue.get(timeout=1)
+                priority, _, job = self.file_queue.get(timeout=1)
+                with self._dedup_lock:
+                    self._queued_paths.discard(job.file_path)
+
                 if job.status == "CANCELLED":
                     continue
 
                 job.status = "PROCESSING"
-                job.start_time = datetime.now()
+                job.mark_started()
+                self._notify_change()
 
                 try:
                     result = self.processor.process_file(job.file_path)
@@ -71,7 +153,8 @@ class QueueManager:
                     job.status = "ERROR"
                     self.logger.error(f"Error processing job {job.id}: {str(e)}")
 
-                job.end_time = datetime.now()
+                job.mark_finished()
+                self._notify_change()
 
             except queue.Empty:
                 continue
@@ -86,19 +169,33 @@ class QueueManager:
         """Get all jobs"""
         return list(self.jobs.values())
 
+    def get_latest_jobs(self, count):
+        """Get up to count of the most recently added jobs, oldest first"""
+        while True:
+            try:
+                latest = list(itertools.islice(reversed(self.jobs.values()), count))
+            except RuntimeError:
+                # A job was added or removed mid-walk; take the snapshot again
+                continue
+            latest.reverse()
+            return latest
+
     def cancel_job(self, job_id):
         """Cancel a pending job"""
         job = self.jobs.get(job_id)
         if job and job.status == "PENDING":
             job.status = "CANCELLED"
+            self._notify_change()
             return True
         return False
 
     def clear_completed_jobs(self):
-        """Clear completed jobs from the jobs dict"""
+        """Clear completed jobs from the jobs dict and return their IDs"""
         completed = []
         for job_id, job in list(self.jobs.items()):
             if job.status in ["COMPLETED", "ERROR", "CANCELLED"]:
                 completed.append(job_id)
                 del self.jobs[job_id]
-        return len(completed)
\ No newline at end of file
+        if completed:
+            self._notify_change()
+        return completed
\ No newline at end of file
@@ -1,16 +1,59 @@
+import os
+import re
 import time
+import fnmatch
 import logging
+import threading
+import psutil
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 
+# Filesystems whose change notifications cannot be relied on; these are polled instead
+NETWORK_FS_TYPES = {'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'afpfs', '9p', 'fuse.sshfs'}
+
+def is_network_path(path):
+    """Check whether a path lives on a network share"""
+    path = os.path.abspath(path)
+    # UNC paths (\\server\share) are always remote
+    if path.startswith('\\\\'):
+        return True
+    try:
+        partitions = psutil.disk_partitions(all=True)
+    except Exception:
+        return False
+
+    # The longest mount point containing the path is the one it lives on
+    path = os.path.normcase(path)
+    best = None
+    for part in partitions:
+        # Compare whole path components so /mnt/nfsbackup is not under /mnt/nfs
+        mount = os.path.normcase(part.mountpoint).rstrip(os.sep)
+        if ((path == mount or path.startswith(mount + os.sep))
+                and (best is None or len(part.mountpoint) > len(best.mountpoint))):
+            best = part
+    if best is None:
+        return False
+    return best.fstype.lower() in NETWORK_FS_TYPES or 'remote' in best.opts.split(',')
+
+def compile_patterns(patterns):
+    """Compile semicolon-separated globs into one case-insensitive regex"""
+    parts = [fnmatch.translate(p.strip()) for p in patterns.split(';') if p.strip()]
+    # An empty pattern list matches nothing
+    return re.compile('|'.join(parts) if parts else r'(?!)', re.IGNORECASE)
+
 class DirectoryWatcher:
     """Watch directory for file changes"""
 
-    def __init__(self, config, file_queue, logger=None):
+    def __init__(self, config, queue_manager, logger=None, on_event=None):
         self.config = config
-        self.file_queue = file_queue
+        self.queue_manager = queue_manager
         self.logger = logger or logging.getLogger('EZCADAutomation')
+        self.on_event = on_event  # Called with a short message per detected file, on the observer thread
         self.observer = None
+        self.event_handler = None
+        self.matcher = None  # Compiled file-name pattern; built from config if unset
+        self._stop_scan = threading.Event()  # Stops a running scan of existing files
 
     def start_watching(self):
         """Start watching the configured directory"""
@@ -20,11 +63,28 @@ class DirectoryWatcher:
                 self.logger.error("Watch directory not configured")
                 return False
 
-            event_handler = FileChangeHandler(self.config, self.file_queue, self.logger)
-            self.observer = Observer()
-            self.observer.schedule(event_handler, watch_dir, recursive=self.config.getboolean('Monitoring', 'recursive'))
+            matcher = self.matcher
+            if matcher is None:
+                matcher = compile_patterns(
+                    self.config.get('Settings', 'file_pattern_excel', '') + ';' +
+                    self.config.get('Settings', 'file_pattern_ezd', ''))
+
+            recursive = self.config.getboolean('Monitoring', 'recursive')
+
+            self.event_handler = FileChangeHandler(self.config, self.queue_manager, self.logger, matcher, self.on_event)
+            self.observer = self._create_observer(watch_dir)
+            self.observer.schedule(self.event_handler, watch_dir, recursive=recursive)
             self.observer.start()
 
+            # Optionally queue files that were already there, off the calling thread;
+            # the queue's path dedup drops any that on_created picks up as well
+            if (self.config.getboolean('Monitoring', 'process_existing', fallback=False)
+                    and self.config.getboolean('Settings', 'auto_trigger')):
+                self._stop_scan = threading.Event()
+                threading.Thread(target=self._queue_existing,
+                                 args=(watch_dir, matcher, recursive, self._stop_scan),
+                                 daemon=True).start()
+
             self.logger.info(f"Started watching directory: {watch_dir}")
             return True
 
@@ -32,8 +92,43 @@ class DirectoryWatcher:
             self.logger.error(f"Error starting directory watcher: {str(e)}")
             return False
 
+    def set_patterns(self, patterns):
+        """Compile semicolon-separated file patterns, applying them to a running watch too"""
+        self.matcher = compile_patterns(patterns)
+        if self.event_handler is not None:
+            self.event_handler.matcher = self.matcher
+
+    def _create_observer(self, watch_dir):
+        """Use native change notifications, polling only on network shares"""
+        if is_network_path(watch_dir):
+            interval = max(1, self.config.getint('Monitoring', 'interval_seconds', 5))
+            self.logger.info(f"Watch directory is on a network share, polling every {interval}s")
+            return PollingObserver(timeout=interval)
+        return Observer()
+
+    def _queue_existing(self, watch_dir, matcher, recursive, stop):
+        """Queue the matching files already in the watch directory (runs on its own thread)"""
+        queued = 0
+        try:
+            for dir_path, dir_names, file_names in os.walk(watch_dir):
+                if stop.is_set():
+                    return
+                for name in file_names:
+                    if matcher.match(name):
+                        file_path = os.path.join(dir_path, name)
+                        if self.queue_manager.add_file_job(file_path):
+                            queued += 1
+                            if self.on_event:
+                                self.on_event(f"Queued existing: {file_path}")
+                if not recursive:
+                    break
+        except Exception as e:
+            self.logger.error(f"Error scanning existing files in {watch_dir}: {str(e)}")
+        self.logger.info(f"Queued {queued} existing files in {watch_dir}")
+
     def stop_watching(self):
         """Stop watching for changes"""
+        self._stop_scan.set()
         if self.observer:
             self.observer.stop()
             self.observer.join()
@@ -42,10 +137,12 @@ class DirectoryWatcher:
 class FileChangeHandler(FileSystemEventHandler):
     """Handle file system events"""
 
-    def __init__(self, config, file_queue, logger):
+    def __init__(self, config, queue_manager, logger, matcher, on_event=None):
         self.config = config
-        self.file_queue = file_queue
+        self.queue_manager = queue_manager
         self.logger = logger
+        self.matcher = matcher
+        self.on_event = on_event
 
     def on_created(self, event):
         """Handle file creation events"""
@@ -55,14 +152,14 @@ class FileChangeHandler(FileSystemEventHandler):
         file_path = event.src_path
         if self._is_valid_file(file_path):
             self.logger.info(f"New file detected: {file_path}")
+            message = f"New file: {file_path}"
             # Add to processing queue if auto-trigger is enabled
             if self.config.getboolean('Settings', 'auto_trigger'):
-                self.file_queue.put((0, file_path))
+                if self.queue_manager.add_file_job(file_path):
+                    message = f"Queued: {file_path}"
+            if self.on_event:
+                self.on_event(message)
 
     def _is_valid_file(self, file_path):
         """Check if the file matches configured patterns"""
-        excel_patterns = self.config.get('Settings', 'file_pattern_excel').split(';')
-        ezd_patterns = self.config.get('Settings', 'file_pattern_ezd').split(';')
-
-        file_path = file_path.lower()
-        return any(file_path.endswith(pat.strip('*').lower()) for pat in excel_patterns + ezd_patterns)
\ No newline at end of file
+        return self.matcher.match(os.path.basename(file_path)) is not None
\ No newline at end of file